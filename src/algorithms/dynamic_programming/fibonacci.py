@@ -1,10 +1,18 @@
+import math  # Import math for lcm when combining Pisano periods
+import operator  # Import operator for the default multiplication hook
 import time  # Import the time module to measure execution time
-from typing import Dict, List, Tuple  # Import typing annotations for better code documentation
+from typing import Dict, Iterable, List, Tuple  # Import typing annotations for better code documentation
+
+import numpy as np  # Import NumPy for the vectorized batch API
 
 class Fibonacci:
     """Fibonacci sequence calculation with visualization support"""
     
+    PISANO_LIMIT = 10 ** 12  # Largest modulus whose Pisano period is computed (needs trial-division factoring)
+    
     def __init__(self):
+        self.multiply = operator.mul  # Multiplication used by the O(log n) engines, replaceable for profiling
+        self.pisano_periods = {}  # Cache of Pisano periods keyed by modulus, kept across resets
         self.reset()  # Initialize the object by calling the reset method
     
     def reset(self):
@@ -13,6 +21,7 @@ class Fibonacci:
         self.execution_time = 0  # Tracker for the execution time
         self.space_used = 0  # Tracker for memory usage
         self.steps = []  # List to store computation steps for visualization
+        self.multiplications = 0  # Counter for big-int multiplications performed
     
     def fibonacci_recursive(self, n: int) -> int:
         """Calculate the nth Fibonacci number using recursion with memoization"""
@@ -50,6 +59,51 @@ class Fibonacci:
         
         return memo[n]  # Return the calculated value
     
+    def fibonacci_memo_iterative(self, n: int) -> int:
+        """
+        Calculate the nth Fibonacci number with memoization, driven by an explicit
+        stack instead of recursion so that n is not bounded by the recursion limit
+        """
+        self.reset()  # Reset all metrics before calculation
+        memo = {}  # Initialize memoization dictionary to store computed values
+        self.steps.append(("init", {}))  # Record initialization step
+        
+        if n <= 0:
+            return 0  # First base case: F(0) = 0
+        if n == 1:
+            return 1  # Second base case: F(1) = 1
+        
+        start_time = time.time()  # Record the start time
+        
+        # Each stack entry is a pending call F(k); F(k-1) is always resolved first,
+        # exactly as the recursive version does
+        stack = [n]  # Start with the top-level call
+        while stack:  # Continue until the top-level call is resolved
+            k = stack[-1]  # Look at the innermost pending call
+            if k - 1 >= 2 and k - 1 not in memo:  # If F(k-1) still has to be computed
+                stack.append(k - 1)  # Descend into F(k-1) first
+                continue
+            
+            stack.pop()  # Both operands of F(k) are now available
+            first = memo[k - 1] if k - 1 >= 2 else 1  # F(k-1), just computed or a base case
+            if k - 2 >= 2:  # F(k-2) comes from the memo
+                self.operations += 1  # Count memo lookup as an operation
+                second = memo[k - 2]  # Read the previously computed value
+                self.steps.append(("memo_hit", k - 2, second))  # Record the memoization hit
+            else:
+                second = k - 2  # Base cases: F(1) = 1 and F(0) = 0
+            
+            self.operations += 1  # Count this calculation as an operation
+            memo[k] = first + second  # Calculate F(k) from the two operands
+            self.steps.append(("memo_calc", k, memo[k]))  # Record the calculation step
+        
+        self.execution_time = time.time() - start_time  # Calculate execution time
+        
+        # Space used is the size of the memoization table
+        self.space_used = len(memo)  # Record the space used by counting entries in memo dict
+        
+        return memo[n]  # Return the calculated Fibonacci number
+    
     def fibonacci_tabulation(self, n: int) -> int:
         """Calculate the nth Fibonacci number using tabulation (bottom-up DP)"""
         self.reset()  # Reset all metrics before calculation
@@ -62,7 +116,7 @@ class Fibonacci:
         if n >= 1:
             table[1] = 1  # Set F(1) = 1 if n is at least 1
         
-        self.steps.append(("init_table", table.copy()))  # Record table initialization
+        self.steps.append(("init_table", table[:2]))  # Record the base cases
         
         start_time = time.time()  # Record the start time
         
@@ -70,7 +124,7 @@ class Fibonacci:
         for i in range(2, n + 1):  # Iterate from 2 to n
             self.operations += 1  # Count each iteration as an operation
             table[i] = table[i-1] + table[i-2]  # Calculate F(i) using F(i-1) and F(i-2)
-            self.steps.append(("table_calc", i, table.copy()))  # Record each step
+            self.steps.append(("table_calc", i, table[i]))  # Record each step
         
         self.execution_time = time.time() - start_time  # Calculate execution time
         
@@ -79,10 +133,234 @@ class Fibonacci:
         
         return table[n]  # Return the final Fibonacci number
     
+    def fibonacci_fast_doubling(self, n: int) -> int:
+        """
+        Calculate the nth Fibonacci number in O(log n) steps using fast doubling:
+        F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2
+        """
+        self.reset()  # Reset all metrics before calculation
+        
+        if n <= 0:
+            return 0  # Handle the case for n <= 0
+        
+        mul = self.multiply  # Local alias for the multiplication hook
+        a, b = 0, 1  # F(k) and F(k+1), starting from k = 0
+        k = 0  # Index of the Fibonacci pair currently held
+        self.steps.append(("init_pair", k, a, b))  # Record the starting pair
+        
+        start_time = time.time()  # Record the start time
+        
+        # Walk the bits of n from the most significant one
+        for bit in bin(n)[2:]:  # Each bit doubles k and optionally adds one
+            self.operations += 1  # Count each doubling as an operation
+            c = mul(a, 2 * b - a)  # F(2k)
+            d = mul(a, a) + mul(b, b)  # F(2k+1)
+            self.multiplications += 3  # Three multiplications per doubling
+            if bit == "1":  # If this bit is set, step to k = 2k + 1
+                a, b = d, c + d  # F(2k+1) and F(2k+2)
+                k = 2 * k + 1  # Update the index
+            else:  # Otherwise step to k = 2k
+                a, b = c, d  # F(2k) and F(2k+1)
+                k = 2 * k  # Update the index
+            self.steps.append(("double", k, a, b))  # Record the new pair
+        
+        self.execution_time = time.time() - start_time  # Calculate execution time
+        
+        # Only the current pair is kept
+        self.space_used = 2  # Two numbers are stored at any time
+        
+        return a  # F(n)
+    
+    def fibonacci_matrix(self, n: int) -> int:
+        """
+        Calculate the nth Fibonacci number in O(log n) steps by raising
+        [[1, 1], [1, 0]] to the nth power with repeated squaring
+        """
+        self.reset()  # Reset all metrics before calculation
+        
+        if n <= 0:
+            return 0  # Handle the case for n <= 0
+        
+        result = ((1, 0), (0, 1))  # Identity matrix
+        base = ((1, 1), (1, 0))  # Fibonacci Q-matrix
+        self.steps.append(("init_matrix", n, result, base))  # Record initial matrices
+        
+        start_time = time.time()  # Record the start time
+        
+        power = n  # Remaining exponent
+        while power:  # Square and multiply until the exponent is consumed
+            self.operations += 1  # Count each exponent bit as an operation
+            if power & 1:  # If the lowest bit is set
+                result = self._matrix_multiply(result, base)  # Multiply it into the result
+                self.steps.append(("matrix_multiply", power, result))  # Record the multiplication
+            power >>= 1  # Move on to the next bit
+            if power:  # Square only while bits remain
+                base = self._matrix_multiply(base, base)  # Square the base
+                self.steps.append(("matrix_square", power, base))  # Record the squaring
+        
+        self.execution_time = time.time() - start_time  # Calculate execution time
+        
+        # Two 2x2 matrices are kept
+        self.space_used = 8  # Eight numbers are stored at any time
+        
+        return result[0][1]  # Q^n = [[F(n+1), F(n)], [F(n), F(n-1)]]
+    
+    def _matrix_multiply(self, x: Tuple[Tuple[int, int], Tuple[int, int]],
+                         y: Tuple[Tuple[int, int], Tuple[int, int]]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Multiply two 2x2 matrices with the multiplication hook"""
+        mul = self.multiply  # Local alias for the multiplication hook
+        self.multiplications += 8  # A plain 2x2 product needs eight multiplications
+        return (
+            (mul(x[0][0], y[0][0]) + mul(x[0][1], y[1][0]), mul(x[0][0], y[0][1]) + mul(x[0][1], y[1][1])),
+            (mul(x[1][0], y[0][0]) + mul(x[1][1], y[1][0]), mul(x[1][0], y[0][1]) + mul(x[1][1], y[1][1]))
+        )
+    
+    def fibonacci_mod(self, n: int, m: int) -> int:
+        """
+        Calculate F(n) mod m with fast doubling, first reducing n modulo the
+        (cached) Pisano period of m so that huge n cost no more than small ones
+        """
+        self.reset()  # Reset all metrics before calculation
+        
+        if m < 1:  # Check for invalid modulus
+            raise ValueError("Modulus must be a positive integer")  # Raise error for invalid modulus
+        if n <= 0 or m == 1:
+            return 0  # F(0) = 0 and everything is 0 mod 1
+        
+        start_time = time.time()  # Record the start time
+        
+        if m <= self.PISANO_LIMIT:  # If the period is affordable to compute
+            period = self.pisano_period(m)  # Look up or compute the Pisano period
+            self.steps.append(("pisano", m, period))  # Record the period used
+            n %= period  # F(n) mod m repeats with this period
+        
+        result = self._fib_pair_mod(n, m)[0]  # Fast doubling modulo m
+        self.steps.append(("final_mod", n, result))  # Record the result
+        
+        self.execution_time = time.time() - start_time  # Calculate execution time
+        self.space_used = 2  # Only the current pair is kept
+        
+        return result  # F(n) mod m
+    
+    def fibonacci_mod_batch(self, ns: Iterable[int], m: int) -> np.ndarray:
+        """
+        Calculate F(n) mod m for many n at once
+        All n are reduced by the Pisano period and then run through fast doubling
+        together, one NumPy operation per bit; moduli of 2^32 and above, whose
+        products overflow 64 bits, fall back to exact Python integers
+        """
+        self.reset()  # Reset all metrics before calculation
+        
+        if m < 1:  # Check for invalid modulus
+            raise ValueError("Modulus must be a positive integer")  # Raise error for invalid modulus
+        
+        values = np.asarray(ns if isinstance(ns, np.ndarray) else list(ns))  # Accept any iterable of integers
+        if values.size and values.min() < 0:  # Check for negative indices
+            raise ValueError("Indices must be non-negative")  # Raise error for negative n
+        
+        start_time = time.time()  # Record the start time
+        
+        if m <= self.PISANO_LIMIT:  # If the period is affordable to compute
+            period = self.pisano_period(m)  # Look up or compute the Pisano period
+            if values.dtype.kind in "iu":  # Machine integers can be reduced in one vectorized step
+                values = values.astype(np.uint64) % np.uint64(period)  # Reduce every index by the period
+            else:  # Python integers beyond 64 bits
+                values = np.array([int(v) % period for v in values], dtype=np.uint64)  # Reduce one by one
+        
+        if m < 2 ** 32 and values.dtype.kind in "iu":  # Products of residues fit in 64 bits
+            result = self._fib_mod_vectorized(values.astype(np.uint64), m)  # Vectorized fast doubling
+        else:
+            result = np.array([self._fib_pair_mod(int(v), m)[0] for v in values.ravel()],
+                              dtype=np.uint64 if m <= 2 ** 64 else object).reshape(values.shape)  # Exact fallback
+        
+        self.execution_time = time.time() - start_time  # Calculate execution time
+        self.space_used = 4 * values.size  # Index, pair and bit mask per element
+        self.steps.append(("batch_mod", values.size, m))  # Record the batch size
+        
+        return result  # F(n) mod m for every n
+    
+    def pisano_period(self, m: int) -> int:
+        """
+        Return the Pisano period of m, the period of F(n) mod m
+        Combines the periods of the prime powers of m with lcm, and caches the result
+        """
+        if m in self.pisano_periods:  # If the period was computed before
+            return self.pisano_periods[m]
+        
+        period = 1  # Period of the trivial modulus
+        for p, k in self._factorize(m).items():  # For each prime power in m
+            period = math.lcm(period, self._prime_power_period(p, k))  # Combine the periods
+        
+        self.pisano_periods[m] = period  # Cache the period for later calls
+        return period
+    
+    def _prime_power_period(self, p: int, k: int) -> int:
+        """
+        Pisano period of p^k
+        Starts from a known multiple of the period and divides out prime
+        factors for as long as the result is still a period
+        """
+        if p == 2:
+            base = 3  # pi(2) = 3
+        elif p == 5:
+            base = 20  # pi(5) = 20
+        elif p % 5 in (1, 4):
+            base = p - 1  # pi(p) divides p - 1 when p = +-1 mod 5
+        else:
+            base = 2 * (p + 1)  # pi(p) divides 2(p + 1) when p = +-2 mod 5
+        
+        modulus = p ** k  # The prime power itself
+        period = base * p ** (k - 1)  # pi(p^k) always divides p^(k-1) * pi(p)
+        factors = self._factorize(base)  # Prime factors that may be divided out
+        factors[p] = factors.get(p, 0) + k - 1  # Include the p^(k-1) factor
+        
+        for q in factors:  # For each prime factor of the candidate
+            while period % q == 0 and self._fib_pair_mod(period // q, modulus) == (0, 1 % modulus):
+                period //= q  # A smaller multiple still returns to (0, 1)
+        return period
+    
+    def _factorize(self, x: int) -> Dict[int, int]:
+        """Factorize x by trial division, returning {prime: exponent}"""
+        factors = {}  # Prime factors found so far
+        d = 2  # Smallest candidate divisor
+        while d * d <= x:  # Only divisors up to sqrt(x) need to be tried
+            while x % d == 0:  # Divide out d as often as possible
+                factors[d] = factors.get(d, 0) + 1  # Count the factor
+                x //= d  # Remove it from x
+            d += 1 if d == 2 else 2  # Try 2, then odd numbers only
+        if x > 1:  # Whatever is left is prime
+            factors[x] = factors.get(x, 0) + 1  # Count the last factor
+        return factors
+    
+    def _fib_pair_mod(self, n: int, m: int) -> Tuple[int, int]:
+        """Return (F(n) mod m, F(n+1) mod m) using fast doubling"""
+        a, b = 0, 1 % m  # F(0) and F(1) modulo m
+        for bit in bin(n)[2:] if n > 0 else "":  # Walk the bits of n from the most significant one
+            self.operations += 1  # Count each doubling as an operation
+            c = a * (2 * b - a) % m  # F(2k) mod m
+            d = (a * a + b * b) % m  # F(2k+1) mod m
+            a, b = (d, (c + d) % m) if bit == "1" else (c, d)  # Step to 2k + 1 or 2k
+        return a, b
+    
+    def _fib_mod_vectorized(self, ns: np.ndarray, m: int) -> np.ndarray:
+        """Fast doubling mod m on a whole uint64 array, for m < 2^32"""
+        mod = np.uint64(m)  # Modulus as a NumPy scalar so that all arithmetic stays in uint64
+        a = np.zeros(ns.shape, dtype=np.uint64)  # F(k) mod m for every element
+        b = np.full(ns.shape, 1 % m, dtype=np.uint64)  # F(k+1) mod m for every element
+        bits = int(ns.max()).bit_length() if ns.size else 0  # Number of doubling rounds needed
+        
+        for shift in range(bits - 1, -1, -1):  # Walk the bits from the most significant one
+            self.operations += 1  # Count each vectorized doubling as an operation
+            c = a * ((2 * b + mod - a) % mod) % mod  # F(2k) mod m
+            d = (a * a % mod + b * b % mod) % mod  # F(2k+1) mod m
+            odd = ((ns >> np.uint64(shift)) & np.uint64(1)).astype(bool)  # Elements whose bit is set
+            a, b = np.where(odd, d, c), np.where(odd, (c + d) % mod, d)  # Step to 2k + 1 or 2k
+        return a
+    
     def compare_methods(self, n: int) -> Tuple[int, Dict]:
-        """Compare both methods and return performance metrics"""
-        # Run recursive with memoization
-        memo_result = self.fibonacci_recursive(n)  # Calculate using memoization
+        """Compare all methods and return performance metrics"""
+        # Run memoization
+        memo_result = self.fibonacci_memo_iterative(n)  # Calculate using memoization
         memo_metrics = {  # Store metrics from memoization method
             "operations": self.operations,
             "execution_time": self.execution_time,
@@ -99,10 +377,30 @@ class Fibonacci:
             "steps": self.steps.copy()
         }
         
-        # Verify both methods give same result
-        assert memo_result == tab_result, "Different results from the two methods!"  # Check results match
+        # Run fast doubling
+        doubling_result = self.fibonacci_fast_doubling(n)  # Calculate using fast doubling
+        doubling_metrics = {  # Store metrics from fast doubling
+            "operations": self.operations,
+            "execution_time": self.execution_time,
+            "space_used": self.space_used,
+            "steps": self.steps.copy()
+        }
+        
+        # Run matrix exponentiation
+        matrix_result = self.fibonacci_matrix(n)  # Calculate using matrix exponentiation
+        matrix_metrics = {  # Store metrics from matrix exponentiation
+            "operations": self.operations,
+            "execution_time": self.execution_time,
+            "space_used": self.space_used,
+            "steps": self.steps.copy()
+        }
+        
+        # Verify all methods give same result
+        assert memo_result == tab_result == doubling_result == matrix_result, "Different results from the methods!"  # Check results match
         
         return memo_result, {  # Return the result and performance metrics
             "memoization": memo_metrics,
-            "tabulation": tab_metrics
+            "tabulation": tab_metrics,
+            "fast_doubling": doubling_metrics,
+            "matrix": matrix_metrics
         }
\ No newline at end of file
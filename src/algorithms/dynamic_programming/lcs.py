@@ -1,5 +1,6 @@
+import bisect  # Import bisect to locate matched runs inside a page
 import time  # Import the time module to measure execution time
-from typing import List, Tuple, Dict  # Import type hints for better code documentation
+from typing import List, Tuple, Dict, Iterator, Optional  # Import type hints for better code documentation
 
 class LCS:
     """
@@ -15,6 +16,8 @@ class LCS:
         self.execution_time = 0  # Tracker for execution time
         self.space_used = 0  # Tracker for memory usage
         self.steps = []  # List to store computation steps for visualization
+        self.edit_distance = 0  # Insertions plus deletions found by the Myers engine
+        self.match_runs = []  # Matched (index1, index2, length) runs of the last LCS found
     
     def find_lcs(self, text1: str, text2: str) -> Tuple[str, List[List[int]]]:
         """
@@ -51,6 +54,7 @@ class LCS:
         
         # Backtrack to find the actual LCS
         lcs = []  # Initialize list to store LCS characters
+        runs = []  # Matched runs along the backtracking path, built backwards
         i, j = m, n  # Start from bottom-right cell of DP table
         
         while i > 0 and j > 0:  # Continue until we reach the first row or column
@@ -59,6 +63,10 @@ class LCS:
                 lcs.append(text1[i-1])  # Add character to LCS
                 i -= 1  # Move diagonally up-left
                 j -= 1
+                if runs and runs[-1][0] == i + 1 and runs[-1][1] == j + 1:  # If this extends the previous run
+                    runs[-1] = (i, j, runs[-1][2] + 1)  # Grow the run one character to the left
+                else:
+                    runs.append((i, j, 1))  # Start a new run
                 self.steps.append(("backtrack_match", dp, text1[i], i, j))  # Record matching in backtracking
             elif dp[i-1][j] > dp[i][j-1]:  # If value from above is larger
                 # Move up in the table
@@ -74,36 +82,200 @@ class LCS:
         # Reverse the LCS (we built it backwards)
         lcs.reverse()  # Reverse to get correct order
         lcs_str = ''.join(lcs)  # Convert list of characters to string
+        runs.reverse()  # Reverse the runs as well
+        self.match_runs = runs  # Keep the matched positions for print_lcs_alignment
         
         # Record final state
         self.steps.append(("final", dp, lcs_str, -1, -1))  # Save final state with LCS result
         
         return lcs_str, dp  # Return the LCS string and DP table
     
-    def print_lcs_alignment(self, text1: str, text2: str, lcs: str) -> str:
+    def find_lcs_myers(self, text1: str, text2: str) -> Tuple[str, List[Tuple[int, int, int]]]:
+        """
+        Find a longest common subsequence using Myers' O((m+n)D) difference algorithm
+        Uses the linear-space middle-snake refinement, so no DP table is built
+        Returns the LCS string and the matched runs as (index1, index2, length) tuples
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        
+        m, n = len(text1), len(text2)  # Get the lengths of both input strings
+        max_d = (m + n + 1) // 2  # Largest half edit distance any sub-problem can need
+        
+        # Shared forward and backward V arrays, reused by every sub-problem
+        offset = max_d + 1  # Offset so that negative diagonals map to valid indices
+        forward = [0] * (2 * max_d + 3)  # Furthest x reached on each diagonal going forward
+        backward = [0] * (2 * max_d + 3)  # Furthest x reached on each diagonal going backward
+        self.space_used = len(forward) + len(backward)  # Space used by the two V arrays
+        
+        self.steps.append(("init", None, "", m, n))  # Record the initial problem size
+        
+        start_time = time.time()  # Record the start time
+        
+        runs = []  # Matched runs found so far (unordered)
+        edit_distance = None  # Edit distance of the full problem, known after the first split
+        pending = [(0, m, 0, n)]  # Explicit stack of sub-problems to avoid deep recursion
+        while pending:  # Continue until every sub-problem has been solved
+            lo1, hi1, lo2, hi2 = pending.pop()  # Take the next sub-problem
+            
+            # Strip the common prefix and suffix, they always belong to an LCS
+            prefix = self._match_forward(text1, lo1, hi1, text2, lo2, hi2)  # Length of the common prefix
+            if prefix:  # If the two ranges start with a common run
+                runs.append((lo1, lo2, prefix))  # Record the prefix as a matched run
+                self.steps.append(("snake", None, prefix, lo1, lo2))  # Record the matched run
+                lo1 += prefix  # Move past the prefix in text1
+                lo2 += prefix  # Move past the prefix in text2
+            suffix = self._match_backward(text1, lo1, hi1, text2, lo2, hi2)  # Length of the common suffix
+            if suffix:  # If the two ranges end with a common run
+                hi1 -= suffix  # Drop the suffix from text1
+                hi2 -= suffix  # Drop the suffix from text2
+                runs.append((hi1, hi2, suffix))  # Record the suffix as a matched run
+                self.steps.append(("snake", None, suffix, hi1, hi2))  # Record the matched run
+            
+            if lo1 == hi1 or lo2 == hi2:  # If one side is empty, only insertions or deletions remain
+                if edit_distance is None:  # If this was the whole problem
+                    edit_distance = (hi1 - lo1) + (hi2 - lo2)  # Every remaining character is an edit
+                continue  # Nothing left to match
+            
+            # Split the problem around its middle snake
+            d, x, y, u, v = self._middle_snake(text1, lo1, hi1, text2, lo2, hi2, forward, backward, offset)
+            if edit_distance is None:  # The first split covers the whole problem
+                edit_distance = d  # Remember the edit distance
+            if u > x:  # If the middle snake has matching characters
+                runs.append((lo1 + x, lo2 + y, u - x))  # Record the middle snake as a matched run
+                self.steps.append(("snake", None, u - x, lo1 + x, lo2 + y))  # Record the matched run
+            pending.append((lo1 + u, hi1, lo2 + v, hi2))  # Sub-problem after the middle snake
+            pending.append((lo1, lo1 + x, lo2, lo2 + y))  # Sub-problem before the middle snake
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        runs.sort()  # Order the runs by their position in text1
+        lcs_str = text1[:0].join(text1[i:i + length] for i, _, length in runs)  # Concatenate the matched runs
+        self.edit_distance = edit_distance or 0  # Number of insertions and deletions needed
+        self.match_runs = runs  # Keep the matched positions for print_lcs_alignment
+        
+        # Record final state
+        self.steps.append(("final", None, lcs_str, -1, -1))  # Save final state with LCS result
+        
+        return lcs_str, runs  # Return the LCS string and the matched runs
+    
+    def _middle_snake(self, text1: str, lo1: int, hi1: int, text2: str, lo2: int, hi2: int,
+                      forward: List[int], backward: List[int], offset: int) -> Tuple[int, int, int, int, int]:
+        """
+        Find the middle snake of text1[lo1:hi1] against text2[lo2:hi2]
+        Both ranges must be non-empty and must not share a common prefix or suffix
+        Returns (edit_distance, x, y, u, v) where the snake runs from (x, y) to (u, v)
+        """
+        m, n = hi1 - lo1, hi2 - lo2  # Sizes of the sub-problem
+        delta = m - n  # Diagonal on which the backward search starts
+        odd = delta & 1  # Overlaps are checked in the forward pass only when delta is odd
+        forward[offset + 1] = 0  # Seed the forward search
+        backward[offset + 1] = 0  # Seed the backward search (in reversed coordinates)
+        
+        for d in range((m + n + 1) // 2 + 1):  # Increase the edit distance one step at a time
+            # Forward search from the top-left corner
+            for k in range(-d, d + 1, 2):  # Visit every reachable diagonal
+                self.operations += 1  # Count each diagonal extension as an operation
+                if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                    x = forward[offset + k + 1]  # Step down from diagonal k+1
+                else:
+                    x = forward[offset + k - 1] + 1  # Step right from diagonal k-1
+                y = x - k  # Matching position in text2
+                start_x, start_y = x, y  # Remember where the snake starts
+                if x < m and y < n:  # If there is room to follow the diagonal
+                    run = self._match_forward(text1, lo1 + x, hi1, text2, lo2 + y, hi2)  # Follow the snake
+                    x += run  # Advance along the diagonal in text1
+                    y += run  # Advance along the diagonal in text2
+                forward[offset + k] = x  # Store the furthest point on this diagonal
+                if odd and delta - d < k < delta + d:  # If the backward search reached this diagonal
+                    if x + backward[offset + delta - k] >= m:  # If the two searches overlap
+                        return 2 * d - 1, start_x, start_y, x, y  # The last forward snake is the middle one
+            
+            # Backward search from the bottom-right corner, in reversed coordinates
+            for k in range(-d, d + 1, 2):  # Visit every reachable diagonal
+                self.operations += 1  # Count each diagonal extension as an operation
+                if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                    x = backward[offset + k + 1]  # Step up from diagonal k+1
+                else:
+                    x = backward[offset + k - 1] + 1  # Step left from diagonal k-1
+                y = x - k  # Matching position in reversed text2
+                start_x, start_y = x, y  # Remember where the snake starts
+                if x < m and y < n:  # If there is room to follow the diagonal
+                    run = self._match_backward(text1, lo1, hi1 - x, text2, lo2, hi2 - y)  # Follow the snake
+                    x += run  # Advance along the diagonal in reversed text1
+                    y += run  # Advance along the diagonal in reversed text2
+                backward[offset + k] = x  # Store the furthest point on this diagonal
+                if not odd and -d <= delta - k <= d:  # If the forward search reached this diagonal
+                    if x + forward[offset + delta - k] >= m:  # If the two searches overlap
+                        return 2 * d, m - x, n - y, m - start_x, n - start_y  # The last backward snake is the middle one
+        
+        raise RuntimeError("Middle snake not found")  # Unreachable for valid input
+    
+    def _match_forward(self, text1: str, i: int, end1: int, text2: str, j: int, end2: int) -> int:
+        """
+        Length of the common run starting at text1[i] and text2[j]
+        Gallops with slice comparisons so that long runs are compared in C
+        """
+        limit = min(end1 - i, end2 - j)  # The run cannot extend past either range
+        if limit <= 0 or text1[i] != text2[j]:  # Most snakes are empty, check one character first
+            return 0
+        
+        matched, probe = 1, 2  # The first character matches, try twice as many next
+        while matched < limit:  # Gallop until a mismatch or the end of a range
+            probe = min(probe, limit)  # Never probe past the end of a range
+            if text1[i + matched:i + probe] != text2[j + matched:j + probe]:  # If a mismatch lies in this window
+                break
+            matched, probe = probe, probe * 2  # Whole window matched, double the probe
+        else:
+            return matched  # The run reaches the end of a range
+        
+        # Binary search the mismatch inside (matched, probe]
+        while probe - matched > 1:  # Until the first mismatching position is isolated
+            mid = (matched + probe) // 2  # Split the window in half
+            if text1[i + matched:i + mid] == text2[j + matched:j + mid]:  # If the lower half matches
+                matched = mid  # The mismatch is in the upper half
+            else:
+                probe = mid  # The mismatch is in the lower half
+        return matched  # Length of the common run
+    
+    def _match_backward(self, text1: str, start1: int, i: int, text2: str, start2: int, j: int) -> int:
+        """
+        Length of the common run ending just before text1[i] and text2[j]
+        Mirror image of _match_forward
+        """
+        limit = min(i - start1, j - start2)  # The run cannot extend past either range
+        if limit <= 0 or text1[i - 1] != text2[j - 1]:  # Most snakes are empty, check one character first
+            return 0
+        
+        matched, probe = 1, 2  # The last character matches, try twice as many next
+        while matched < limit:  # Gallop until a mismatch or the start of a range
+            probe = min(probe, limit)  # Never probe past the start of a range
+            if text1[i - probe:i - matched] != text2[j - probe:j - matched]:  # If a mismatch lies in this window
+                break
+            matched, probe = probe, probe * 2  # Whole window matched, double the probe
+        else:
+            return matched  # The run reaches the start of a range
+        
+        # Binary search the mismatch inside (matched, probe]
+        while probe - matched > 1:  # Until the first mismatching position is isolated
+            mid = (matched + probe) // 2  # Split the window in half
+            if text1[i - mid:i - matched] == text2[j - mid:j - matched]:  # If the lower half matches
+                matched = mid  # The mismatch is in the upper half
+            else:
+                probe = mid  # The mismatch is in the lower half
+        return matched  # Length of the common run
+    
+    def print_lcs_alignment(self, text1: str, text2: str, lcs: str,
+                            runs: Optional[List[Tuple[int, int, int]]] = None) -> str:
         """
         Create a visual alignment of the two strings showing the LCS
         Returns a formatted string showing the alignment
         """
-        # Map LCS characters to their positions in text1 and text2
-        positions1 = self._find_lcs_positions(text1, lcs)  # Find positions of LCS characters in text1
-        positions2 = self._find_lcs_positions(text2, lcs)  # Find positions of LCS characters in text2
+        runs = self._alignment_runs(text1, lcs, runs)  # Matched runs to mark
         
         # Create alignment visualization
         alignment = []  # Initialize list for alignment strings
         alignment.append(f"String 1: {text1}")  # Add the first string to alignment
-        
-        # Create match line
-        match_line = ""  # Initialize match line
-        pos1_idx = 0  # Index to track position in the positions1 list
-        for i, char in enumerate(text1):  # For each character in text1
-            if pos1_idx < len(positions1) and i == positions1[pos1_idx]:  # If current position is part of LCS
-                match_line += "|"  # Add a vertical bar to show match
-                pos1_idx += 1  # Move to next position
-            else:
-                match_line += " "  # Add space for non-matching character
-        alignment.append(f"Match:    {match_line}")  # Add match line to alignment
-        
+        alignment.append(f"Match:    {self._match_line(runs, 0, len(text1))}")  # Add match line to alignment
         alignment.append(f"String 2: {text2}")  # Add the second string to alignment
         
         # Add the LCS
@@ -111,14 +283,87 @@ class LCS:
         
         return "\n".join(alignment)  # Join all lines with newlines and return
     
-    def _find_lcs_positions(self, text: str, lcs: str) -> List[int]:
-        """Find positions of LCS characters in the original text"""
+    def iter_lcs_alignment(self, text1: str, text2: str, lcs: str,
+                           runs: Optional[List[Tuple[int, int, int]]] = None,
+                           page_size: int = 4096) -> Iterator[str]:
+        """
+        Paged version of print_lcs_alignment for large inputs
+        Yields one page at a time, each holding at most page_size characters per line
+        """
+        if page_size <= 0:  # Check for invalid page size
+            raise ValueError("Page size must be positive")  # Raise error for empty pages
+        
+        runs = self._alignment_runs(text1, lcs, runs)  # Matched runs to mark
+        
+        # String 1 and its match line are paged together so that the marks stay aligned
+        for start in range(0, max(len(text1), 1), page_size):  # For each page of text1
+            end = min(start + page_size, len(text1))  # End of this page
+            yield "\n".join((  # Build the page with a single join
+                f"String 1 [{start}:{end}]: {text1[start:end]}",
+                f"Match    [{start}:{end}]: {self._match_line(runs, start, end)}"
+            ))
+        
+        for start in range(0, max(len(text2), 1), page_size):  # For each page of text2
+            end = min(start + page_size, len(text2))  # End of this page
+            yield f"String 2 [{start}:{end}]: {text2[start:end]}"  # Yield the page
+        
+        for start in range(0, max(len(lcs), 1), page_size):  # For each page of the LCS
+            end = min(start + page_size, len(lcs))  # End of this page
+            yield f"LCS      [{start}:{end}]: {lcs[start:end]}"  # Yield the page
+    
+    def _alignment_runs(self, text1: str, lcs: str,
+                        runs: Optional[List[Tuple[int, int, int]]]) -> List[Tuple[int, int, int]]:
+        """
+        Pick the matched runs to draw: the given runs, the runs recorded by the last
+        find_lcs/find_lcs_myers call if they spell out lcs, or a greedy embedding
+        """
+        if runs is not None:  # Caller supplied the runs explicitly
+            return runs
+        if self._runs_spell(text1, self.match_runs, lcs):  # If the last search produced this LCS
+            return self.match_runs
+        return self._find_lcs_positions(text1, lcs)  # Fall back to the greedy embedding
+    
+    def _runs_spell(self, text: str, runs: List[Tuple[int, int, int]], lcs: str) -> bool:
+        """Check whether the runs lie inside text and spell out lcs"""
+        if sum(length for _, _, length in runs) != len(lcs):  # Cheap length check first
+            return False
+        pos = 0  # Position in the LCS
+        for i, _, length in runs:  # For each matched run
+            if text[i:i + length] != lcs[pos:pos + length]:  # If the run disagrees with the LCS
+                return False
+            pos += length  # Move past this run in the LCS
+        return True  # Every run matches
+    
+    def _match_line(self, runs: List[Tuple[int, int, int]], start: int, end: int) -> str:
+        """Build the '|' match markers for text1[start:end] from the matched runs"""
+        parts = []  # Pieces of the match line
+        pos = start  # Next position in text1 to render
+        first = max(bisect.bisect_left(runs, (start,)) - 1, 0)  # First run that may overlap the page
+        for i, _, length in runs[first:]:  # For each run from the page onwards
+            if i >= end:  # Runs past the page are not needed
+                break
+            run_start, run_end = max(i, pos), min(i + length, end)  # Clip the run to the page
+            if run_end <= run_start:  # If the run ends before the page
+                continue
+            parts.append(" " * (run_start - pos))  # Unmatched characters before the run
+            parts.append("|" * (run_end - run_start))  # Matched characters of the run
+            pos = run_end  # Continue after the run
+        parts.append(" " * (end - pos))  # Unmatched characters after the last run
+        return "".join(parts)  # Join the pieces once
+    
+    def _find_lcs_positions(self, text: str, lcs: str) -> List[Tuple[int, int, int]]:
+        """
+        Find positions of LCS characters in the original text by greedy leftmost matching
+        Returns them as (index, lcs_index, 1) runs
+        """
         positions = []  # Initialize list to store positions
         lcs_idx = 0  # Index to track position in LCS string
         
         for i, char in enumerate(text):  # For each character in the text
-            if lcs_idx < len(lcs) and char == lcs[lcs_idx]:  # If current character matches current LCS character
-                positions.append(i)  # Record the position
+            if lcs_idx == len(lcs):  # Stop once every LCS character is placed
+                break
+            if char == lcs[lcs_idx]:  # If current character matches current LCS character
+                positions.append((i, lcs_idx, 1))  # Record the position
                 lcs_idx += 1  # Move to next LCS character
         
         return positions  # Return list of positions
\ No newline at end of file
@@ -1,5 +1,10 @@
+import bisect  # Import bisect to find the latest compatible activity in O(log n)
+import heapq  # Import heapq to merge sorted runs during the external sort
+import os  # Import os to build paths for the sorted run files
+import tempfile  # Import tempfile for the external sort's scratch directory
 import time  # Import the time module to measure execution time
-from typing import List, Tuple, Dict  # Import type hints for better code documentation
+from array import array  # Import array for compact binary run files
+from typing import List, Tuple, Dict, Iterable, Iterator, Optional  # Import type hints for better code documentation
 
 class ActivitySelection:
     """
@@ -23,7 +28,7 @@ class ActivitySelection:
         Args:
             start_times: List of activity start times
             end_times: List of activity end times
-            
+        
         Returns:
             List of indices of selected activities
         """
@@ -53,7 +58,7 @@ class ActivitySelection:
         last_finish_time = activities[0][1]  # Track the finish time of the last selected activity
         
         self.operations += 1  # Count first selection as an operation
-        self.steps.append(("select", activities[0], selected.copy(), last_finish_time))  # Record first selection
+        self.steps.append(("select", activities[0], len(selected), last_finish_time))  # Record first selection
         
         # Consider all remaining activities
         for i in range(1, n):  # Iterate through remaining activities
@@ -64,9 +69,9 @@ class ActivitySelection:
             if current_activity[0] >= last_finish_time:  # Check if current activity starts after last selected activity ends
                 selected.append(current_activity[2])  # Add original index to selected list
                 last_finish_time = current_activity[1]  # Update last finish time
-                self.steps.append(("select", current_activity, selected.copy(), last_finish_time))  # Record selection
+                self.steps.append(("select", current_activity, len(selected), last_finish_time))  # Record selection
             else:
-                self.steps.append(("skip", current_activity, selected.copy(), last_finish_time))  # Record skipping activity
+                self.steps.append(("skip", current_activity, len(selected), last_finish_time))  # Record skipping activity
         
         self.execution_time = time.time() - start_time  # Calculate total execution time
         
@@ -75,7 +80,130 @@ class ActivitySelection:
         
         return selected  # Return list of selected activity indices
     
-    def dp_select_activities(self, start_times: List[int], end_times: List[int]) -> List[int]:
+    def stream_select_activities(self, intervals: Iterable[Tuple[int, int]]) -> Iterator[Tuple[int, int, int]]:
+        """
+        Greedy selection over a stream of (start, end) pairs that arrive in
+        finish-time order, using O(1) memory
+        
+        Args:
+            intervals: Iterable of (start, end) pairs sorted by end time
+        
+        Yields:
+            (index, start, end) of each selected activity as soon as it is selected,
+            where index is the position of the pair in the stream
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        
+        last_finish_time = None  # Finish time of the last selected activity
+        previous_end = None  # End time of the previous activity, to check the order
+        for index, (start, end) in enumerate(intervals):  # Consume the stream one activity at a time
+            self.operations += 1  # Count each activity consideration as an operation
+            if previous_end is not None and end < previous_end:  # The greedy choice needs finish-time order
+                raise ValueError(f"Activity {index} ends at {end}, before the previous activity ({previous_end}); "
+                                 "use stream_select_unsorted for unsorted input")
+            previous_end = end  # Remember this end time
+            
+            if last_finish_time is None or start >= last_finish_time:  # If it starts after the last selected one ends
+                last_finish_time = end  # Update last finish time
+                yield index, start, end  # Emit the selection immediately
+    
+    def stream_select_unsorted(self, intervals: Iterable[Tuple[int, int]], chunk_size: int = 1_000_000,
+                               tmp_dir: Optional[str] = None) -> Iterator[Tuple[int, int, int]]:
+        """
+        Greedy selection over a stream of (start, end) pairs in any order
+        The pairs are sorted by end time with an external merge sort, so memory
+        stays bounded by chunk_size however long the stream is
+        
+        Args:
+            intervals: Iterable of (start, end) pairs in any order
+            chunk_size: Number of activities sorted in memory at a time
+            tmp_dir: Directory for the sorted run files (system default if None)
+        
+        Yields:
+            (index, start, end) of each selected activity, where index is the
+            position of the pair in the input stream
+        """
+        sorted_activities = self.external_sort_activities(intervals, chunk_size, tmp_dir)  # Lazily sorted stream
+        try:
+            last_finish_time = None  # Finish time of the last selected activity
+            for end, start, index in sorted_activities:  # Consume the merged runs
+                self.operations += 1  # Count each activity consideration as an operation
+                if last_finish_time is None or start >= last_finish_time:  # If it starts after the last selected one ends
+                    last_finish_time = end  # Update last finish time
+                    yield index, start, end  # Emit the selection immediately
+        finally:
+            sorted_activities.close()  # Remove the run files even if the caller stops early
+    
+    def external_sort_activities(self, intervals: Iterable[Tuple[int, int]], chunk_size: int = 1_000_000,
+                                 tmp_dir: Optional[str] = None) -> Iterator[Tuple[int, int, int]]:
+        """
+        Sort a stream of (start, end) pairs by end time with an external merge sort:
+        chunks of chunk_size activities are sorted in memory and written as binary
+        run files, then the runs are merged lazily with heapq.merge
+        
+        Yields:
+            (end, start, index) triples in finish-time order
+        """
+        if chunk_size <= 0:  # Check for invalid chunk size
+            raise ValueError("Chunk size must be positive")  # Raise error for empty chunks
+        
+        self.reset()  # Reset all metrics before starting the algorithm
+        
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:  # Scratch space, removed when done
+            run_paths = []  # One file per sorted run
+            chunk = []  # Activities of the run being collected
+            for index, (start, end) in enumerate(intervals):  # Read the whole stream once
+                chunk.append((end, start, index))  # End first so that tuples sort by finish time
+                if len(chunk) == chunk_size:  # If the chunk is full
+                    run_paths.append(self._write_run(chunk, run_dir, len(run_paths)))  # Sort and spill it
+                    chunk = []  # Start a new chunk
+            if chunk:  # Spill the last, partial chunk
+                run_paths.append(self._write_run(chunk, run_dir, len(run_paths)))
+            chunk = None  # Free the last chunk before merging
+            
+            self.steps.append(("runs", len(run_paths)))  # Record the number of sorted runs
+            yield from heapq.merge(*(self._read_run(path) for path in run_paths))  # Merge all runs lazily
+    
+    def read_activity_file(self, path: str, chunk_lines: int = 65536) -> Iterator[Tuple[int, int]]:
+        """
+        Read (start, end) pairs from a text file with one "start,end" line per activity,
+        chunk_lines lines at a time
+        """
+        with open(path) as file:  # Open the activity log
+            while True:  # Read chunk after chunk
+                lines = file.readlines(chunk_lines * 16)  # Roughly chunk_lines lines per read
+                if not lines:  # End of file
+                    break
+                for line in lines:  # Parse the chunk
+                    line = line.strip()  # Ignore surrounding whitespace
+                    if line:  # Skip blank lines
+                        start, end = line.split(',')  # Split the two fields
+                        yield int(start), int(end)  # Emit the activity
+    
+    def _write_run(self, chunk: List[Tuple[int, int, int]], run_dir: str, number: int) -> str:
+        """Sort one chunk by end time and write it as a binary run file of (end, start, index) triples"""
+        chunk.sort()  # Sort by end time, then start time, then arrival order
+        path = os.path.join(run_dir, f"run_{number}.bin")  # File for this run
+        with open(path, "wb") as file:  # Write the run
+            array('q', (value for triple in chunk for value in triple)).tofile(file)  # Flatten into 64-bit integers
+        return path
+    
+    def _read_run(self, path: str, block: int = 65536) -> Iterator[Tuple[int, int, int]]:
+        """Stream (end, start, index) triples back from a run file, block triples at a time"""
+        with open(path, "rb") as file:  # Read the run
+            while True:  # Read block after block
+                values = array('q')  # Buffer for one block
+                try:
+                    values.fromfile(file, 3 * block)  # Read a full block
+                except EOFError:  # The last block is shorter; fromfile keeps what it read
+                    pass
+                if not values:  # End of file
+                    break
+                for i in range(0, len(values), 3):  # Regroup into triples
+                    yield values[i], values[i + 1], values[i + 2]
+    
+    def dp_select_activities(self, start_times: List[int], end_times: List[int],
+                             record_steps: bool = True) -> List[int]:
         """
         Select maximum number of activities using dynamic programming.
         This is for comparison to show that the greedy solution is optimal.
@@ -83,10 +211,41 @@ class ActivitySelection:
         Args:
             start_times: List of activity start times
             end_times: List of activity end times
-            
+            record_steps: Whether to log one compact step per activity
+        
         Returns:
             List of indices of selected activities
         """
+        _, selected = self._interval_dp(start_times, end_times, None, record_steps)  # Every activity is worth 1
+        return selected  # Return list of selected activity indices
+    
+    def weighted_select_activities(self, start_times: List[int], end_times: List[int], values: List[int],
+                                   record_steps: bool = True) -> Tuple[int, List[int]]:
+        """
+        Select non-overlapping activities with the largest total value
+        (weighted interval scheduling), where greedy is no longer optimal
+        
+        Args:
+            start_times: List of activity start times
+            end_times: List of activity end times
+            values: List of activity values
+            record_steps: Whether to log one compact step per activity
+        
+        Returns:
+            Total value and list of indices of selected activities
+        """
+        if len(values) != len(start_times):  # Verify there is one value per activity
+            raise ValueError("Values must have the same length as the time lists")  # Raise error if lengths differ
+        return self._interval_dp(start_times, end_times, values, record_steps)  # Run the shared DP
+    
+    def _interval_dp(self, start_times: List[int], end_times: List[int], values: Optional[List[int]],
+                     record_steps: bool) -> Tuple[int, List[int]]:
+        """
+        Shared O(n log n) DP for dp_select_activities and weighted_select_activities
+        best[i] = best value using the first i activities in finish-time order;
+        the latest activity compatible with activity i is found by binary search
+        over the sorted finish times
+        """
         self.reset()  # Reset all metrics before starting the algorithm
         
         # Check for valid input
@@ -95,56 +254,49 @@ class ActivitySelection:
         
         n = len(start_times)  # Get the number of activities
         if n == 0:  # Handle empty input case
-            return []  # Return empty list if no activities
+            return 0, []  # Nothing to select
         
         # Create activities as (start, end, index) tuples and sort by end time
         activities = [(start_times[i], end_times[i], i) for i in range(n)]  # Create tuples with (start, end, original index)
         activities.sort(key=lambda x: x[1])  # Sort activities based on end time (earliest first)
+        finish = [activity[1] for activity in activities]  # Sorted finish times for binary search
         
         # Record initial state
-        self.steps.append(("init", activities.copy()))  # Save the initial sorted activities
+        if record_steps:  # Only log when asked to
+            self.steps.append(("init", activities.copy()))  # Save the initial sorted activities
         
         start_time = time.time()  # Record the start time
         
-        # Initialize DP table
-        # dp[i] = max activities we can select from activities[0...i]
-        dp = [0] * n  # Create array to store maximum activities up to index i
-        dp[0] = 1  # We can always select the first activity
-        
-        # Initialize array to store the selected activities
-        prev = [-1] * n  # prev[i] = previous selected activity before i
+        best = [0] * (n + 1)  # best[i] = best value using activities[0...i-1]
+        take = [False] * n  # Whether activity i is part of the best solution for best[i+1]
+        compatible = [0] * n  # Number of activities that finish before activity i starts
         
         # Fill dp table
-        for i in range(1, n):  # Iterate through activities starting from index 1
-            # Find the latest activity j that doesn't overlap with i
-            j = i - 1  # Start from the activity just before current
-            while j >= 0 and activities[j][1] > activities[i][0]:  # While activities overlap
-                j -= 1  # Move to earlier activity
-            
+        for i, (start, _, index) in enumerate(activities):  # Iterate through activities in finish order
             self.operations += 1  # Count each DP calculation as an operation
+            j = bisect.bisect_right(finish, start, 0, i)  # Activities 0...j-1 finish no later than this one starts
+            compatible[i] = j  # Remember where to continue when backtracking
             
-            # Max activities if we include activity i
-            include_i = 1 + (dp[j] if j >= 0 else 0)  # 1 (for current activity) + max activities ending at j
-            
-            # Max activities if we exclude activity i
-            exclude_i = dp[i-1]  # Max activities up to previous position
+            include_i = (values[index] if values is not None else 1) + best[j]  # Value when including activity i
+            exclude_i = best[i]  # Best value without activity i
             
             if include_i > exclude_i:  # If including current activity gives better result
-                dp[i] = include_i  # Update DP value
-                prev[i] = j  # Set previous activity
-                self.steps.append(("dp_include", activities[i], j, dp.copy()))  # Record including activity
+                best[i + 1] = include_i  # Update DP value
+                take[i] = True  # Activity i is used
+                if record_steps:  # Only log when asked to
+                    self.steps.append(("dp_include", index, j - 1, include_i))  # Record including activity
             else:
-                dp[i] = exclude_i  # Update DP value
-                prev[i] = prev[i-1]  # Set previous activity same as for i-1
-                self.steps.append(("dp_exclude", activities[i], i-1, dp.copy()))  # Record excluding activity
+                best[i + 1] = exclude_i  # Update DP value
+                if record_steps:  # Only log when asked to
+                    self.steps.append(("dp_exclude", index, i - 1, exclude_i))  # Record excluding activity
         
         # Reconstruct solution
         selected = []  # Initialize list for selected activities
-        i = n - 1  # Start from the last activity
-        while i >= 0:  # Continue until we've considered all activities
-            if i == 0 or prev[i] != prev[i-1]:  # If this is first activity or current selection differs from previous
-                selected.append(activities[i][2])  # Add original index to selected list
-                i = prev[i]  # Jump to previous selected activity
+        i = n  # Start from the full prefix
+        while i > 0:  # Continue until we've considered all activities
+            if take[i - 1]:  # If the last activity of this prefix was used
+                selected.append(activities[i - 1][2])  # Add original index to selected list
+                i = compatible[i - 1]  # Jump to the activities compatible with it
             else:
                 i -= 1  # Move to previous activity
         
@@ -154,9 +306,10 @@ class ActivitySelection:
         self.execution_time = time.time() - start_time  # Calculate total execution time
         
         # Record final state
-        self.steps.append(("final", None, selected.copy(), -1))  # Save final state
+        if record_steps:  # Only log when asked to
+            self.steps.append(("final", None, selected.copy(), -1))  # Save final state
         
-        return selected  # Return list of selected activity indices
+        return best[n], selected  # Return best value and list of selected activity indices
     
     def compare_approaches(self, start_times: List[int], end_times: List[int]) -> Dict:
         """Compare greedy and DP approaches for activity selection"""
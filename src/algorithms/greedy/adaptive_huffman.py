@@ -0,0 +1,307 @@
+import time  # Import the time module to measure execution time
+from bisect import bisect_right  # Import bisect_right to find the highest node of a given weight
+from typing import Tuple  # Import type hints for better code documentation
+
+END_OF_STREAM = 256  # Symbol sent by flush after the last byte
+SYMBOLS = 257  # Byte values plus the end-of-stream symbol
+SYMBOL_BITS = 9  # Bits of a symbol sent in full the first time it appears
+NYT = SYMBOLS  # Symbol value of the "not yet transmitted" leaf
+INTERNAL = -1  # Symbol value of internal nodes
+
+class AdaptiveHuffmanTree:
+    """
+    Adaptive Huffman tree (algorithm FGK) shared by the encoder and the decoder
+    Nodes live in parallel lists indexed by their implicit number: weights never decrease
+    with the number and siblings are numbered next to each other (the sibling property).
+    After each symbol the path from its leaf to the root is incremented, swapping every
+    node with the highest-numbered node of the same weight first, which keeps the tree a
+    Huffman tree for the counts so far in O(code length) steps.
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Start over with a tree holding only the NYT leaf"""
+        size = 2 * (SYMBOLS + 1) - 1  # Every symbol plus the NYT leaf, and their internal nodes
+        self.root = size - 1  # The root has the highest number
+        self.weight = [0] * size  # Weight of every node (unused numbers stay 0)
+        self.parent = [-1] * size  # Parent of every node
+        self.left = [-1] * size  # Left (0) child of every node
+        self.right = [-1] * size  # Right (1) child of every node
+        self.symbol = [INTERNAL] * size  # Symbol of every leaf
+        self.leaf = [-1] * SYMBOLS  # Leaf of every symbol seen so far
+        self.nyt = self.root  # The NYT leaf starts as the whole tree
+        self.symbol[self.root] = NYT
+    
+    def path(self, node: int) -> Tuple[int, int]:
+        """Code of a node as (bits, number of bits), read from the leaf up"""
+        value = length = 0  # Code so far
+        parent, right = self.parent, self.right  # Local names for the loop
+        while node != self.root:  # Climb to the root
+            up = parent[node]  # Parent of this node
+            if right[up] == node:  # Right children add a 1 bit
+                value |= 1 << length
+            length += 1  # One more bit
+            node = up  # Continue from the parent
+        return value, length
+    
+    def update(self, symbol: int) -> int:
+        """
+        Count one more occurrence of symbol and restore the sibling property
+            
+        Returns:
+            Number of nodes whose weight was incremented
+        """
+        weight, parent = self.weight, self.parent  # Local names for the loop
+        q = self.leaf[symbol]  # Leaf of the symbol
+        if q < 0:  # First occurrence: the NYT leaf gets a new NYT and the symbol as children
+            q = self._split_nyt(symbol)  # The new leaf, weight 0
+        
+        # A leaf next to the NYT leaf has the same weight as its parent, so it may only
+        # trade places with a leaf (never with its own parent)
+        if parent[q] == parent[self.nyt]:
+            w = weight[q]  # Weight of the leaf
+            leader = bisect_right(weight, w, q) - 1  # Highest-numbered node of that weight
+            while self.symbol[leader] == INTERNAL:  # Settle for the highest leaf among them
+                leader -= 1
+            if leader != q:  # Move the leaf to the top of its block
+                self._swap(q, leader)
+                q = leader
+            weight[q] += 1  # Count the occurrence
+            q = parent[q]  # Continue with the parent
+        
+        updated = 1  # Nodes incremented so far
+        while q != self.root:  # Walk up to the root
+            # Everything numbered above q is in order, so the block leader can be bisected
+            leader = bisect_right(weight, weight[q], q) - 1  # Highest-numbered node of the same weight
+            if leader != q:  # Move q to the top of its block
+                self._swap(q, leader)
+                q = leader
+            weight[q] += 1  # q is still the highest of its old weight, so the order holds
+            q = parent[q]  # Continue with the parent
+            updated += 1
+        weight[self.root] += 1  # The root counts every symbol
+        return updated
+    
+    def _split_nyt(self, symbol: int) -> int:
+        """Give the NYT leaf two children, a new NYT leaf (left) and a leaf for symbol (right)"""
+        node = self.nyt  # Becomes an internal node
+        nyt, leaf = node - 2, node - 1  # Next free numbers, left child below the right one
+        self.left[node], self.right[node] = nyt, leaf  # Link the children
+        self.parent[nyt] = self.parent[leaf] = node
+        self.symbol[node], self.symbol[nyt], self.symbol[leaf] = INTERNAL, NYT, symbol
+        self.leaf[symbol] = leaf  # The symbol has a leaf now
+        self.nyt = nyt
+        return leaf
+    
+    def _swap(self, a: int, b: int):
+        """Exchange the subtrees at numbers a and b (of equal weight), keeping the numbers in place"""
+        symbol, left, right, parent = self.symbol, self.left, self.right, self.parent  # Local names
+        symbol[a], symbol[b] = symbol[b], symbol[a]  # Swap the contents of the two positions
+        left[a], left[b] = left[b], left[a]
+        right[a], right[b] = right[b], right[a]
+        for node in (a, b):  # Reattach what now hangs below each position
+            if symbol[node] == INTERNAL:  # Children point back to their new parent
+                parent[left[node]] = parent[right[node]] = node
+            elif symbol[node] == NYT:  # The NYT leaf moved
+                self.nyt = node
+            else:  # A symbol leaf moved
+                self.leaf[symbol[node]] = node
+
+class AdaptiveHuffmanEncoder:
+    """
+    Incremental adaptive Huffman encoder for byte streams
+    feed() returns the complete bytes produced so far, flush() ends the stream with an
+    end-of-stream symbol and the last, zero-padded byte. A byte seen for the first time
+    is sent as the NYT code followed by its 9-bit value.
+    """
+    
+    def __init__(self, record_steps: bool = False):
+        self.tree = AdaptiveHuffmanTree()  # Model, kept in step with the decoder's
+        self.record_steps = record_steps  # Whether to log every symbol for visualization
+        self.operations = 0  # Counter for number of operations performed
+        self.steps = []  # List to store computation steps for visualization
+        self.buffer = 0  # Bits not yet written out
+        self.buffered = 0  # Number of those bits (always below 8 between calls)
+        self.closed = False  # Whether flush has been called
+    
+    def feed(self, data: bytes) -> bytes:
+        """Encode more bytes, returning the whole bytes of code they complete"""
+        if self.closed:  # The end-of-stream symbol has been sent
+            raise ValueError("The encoder has already been flushed")  # Raise error for late data
+        out = bytearray()  # Encoded bytes
+        for byte in data:  # Encode every byte
+            self._write_symbol(byte, out)
+        return bytes(out)
+    
+    def flush(self) -> bytes:
+        """End the stream, returning the remaining bytes"""
+        if self.closed:  # Only one end-of-stream symbol per stream
+            raise ValueError("The encoder has already been flushed")  # Raise error for double flush
+        out = bytearray()  # Encoded bytes
+        self._write_symbol(END_OF_STREAM, out)  # Tell the decoder where the data ends
+        if self.buffered:  # Pad the last byte with zeros
+            out.append(self.buffer << (8 - self.buffered) & 0xFF)
+        self.buffer = self.buffered = 0
+        self.closed = True
+        return bytes(out)
+    
+    def _write_symbol(self, symbol: int, out: bytearray):
+        """Append the code of symbol to the bit buffer and update the tree"""
+        tree = self.tree  # Local name
+        node = tree.leaf[symbol]  # Leaf of the symbol, if it was seen before
+        if node < 0:  # New symbol: NYT code, then the symbol itself
+            value, length = tree.path(tree.nyt)
+            value, length = value << SYMBOL_BITS | symbol, length + SYMBOL_BITS
+        else:
+            value, length = tree.path(node)
+        if self.record_steps:  # Only log when asked to
+            self.steps.append(("symbol", symbol, format(value, f"0{length}b")))  # Record the code sent
+        
+        buffer, buffered = self.buffer << length | value, self.buffered + length  # Append the code
+        if buffered >= 8:  # Write out the whole bytes
+            spare = buffered & 7  # Bits that stay behind
+            out += (buffer >> spare).to_bytes(buffered >> 3, "big")
+            buffer, buffered = buffer & ((1 << spare) - 1), spare
+        self.buffer, self.buffered = buffer, buffered
+        
+        self.operations += tree.update(symbol)  # Count every incremented node as an operation
+
+class AdaptiveHuffmanDecoder:
+    """
+    Incremental adaptive Huffman decoder for streams written by AdaptiveHuffmanEncoder
+    feed() returns the bytes decoded so far, flush() checks that the stream was complete
+    """
+    
+    def __init__(self, record_steps: bool = False):
+        self.tree = AdaptiveHuffmanTree()  # Model, kept in step with the encoder's
+        self.record_steps = record_steps  # Whether to log every symbol for visualization
+        self.operations = 0  # Counter for number of operations performed
+        self.steps = []  # List to store computation steps for visualization
+        self.node = self.tree.root  # Current position while walking down the tree
+        self.raw_bits = SYMBOL_BITS  # Bits of a new symbol still to read (the first symbol is always new)
+        self.raw_value = 0  # New symbol read so far
+        self.finished = False  # Whether the end-of-stream symbol was decoded
+    
+    def feed(self, data: bytes) -> bytes:
+        """Decode more bytes, returning the bytes they complete"""
+        out = bytearray()  # Decoded bytes
+        tree = self.tree  # Local names for the loop
+        left, right, symbols = tree.left, tree.right, tree.symbol
+        for byte in data:  # Every incoming byte
+            if self.finished:  # Only padding may follow the end-of-stream symbol, in its own byte
+                raise ValueError("Data after the end of the stream")  # Raise error for trailing data
+            for shift in range(7, -1, -1):  # Its bits, most significant first
+                bit = byte >> shift & 1  # Next bit
+                if self.raw_bits:  # Reading the value of a new symbol
+                    self.raw_value = self.raw_value << 1 | bit
+                    self.raw_bits -= 1
+                    if not self.raw_bits:  # The value is complete
+                        if self.raw_value >= SYMBOLS or tree.leaf[self.raw_value] >= 0:  # Not a new symbol
+                            raise ValueError("Invalid new symbol in the stream")  # Raise error for corrupt streams
+                        self._emit(self.raw_value, out)
+                        self.raw_value = 0
+                else:
+                    self.node = right[self.node] if bit else left[self.node]  # Walk down
+                    symbol = symbols[self.node]
+                    if symbol == NYT:  # A new symbol follows in full
+                        self.raw_bits = SYMBOL_BITS
+                    elif symbol != INTERNAL:  # Reached a known symbol
+                        self._emit(symbol, out)
+                if self.finished:  # The rest of the byte is padding
+                    break
+        return bytes(out)
+    
+    def flush(self) -> bytes:
+        """Check that the stream ended with its end-of-stream symbol"""
+        if not self.finished:  # The encoder was never flushed, or data is missing
+            raise ValueError("The stream ended before its end-of-stream symbol")  # Raise error for truncated streams
+        return b""  # Every byte was returned by feed
+    
+    def _emit(self, symbol: int, out: bytearray):
+        """Output a decoded symbol, update the tree and go back to the root"""
+        if self.record_steps:  # Only log when asked to
+            self.steps.append(("symbol", symbol))  # Record the decoded symbol
+        if symbol == END_OF_STREAM:  # Nothing follows
+            self.finished = True
+            return
+        out.append(symbol)  # Output the byte
+        self.operations += self.tree.update(symbol)  # Count every incremented node as an operation
+        self.node = self.tree.root  # Next code starts at the root
+
+class AdaptiveHuffmanCoding:
+    """
+    One-pass (adaptive) Huffman coding of byte strings
+    Unlike HuffmanCoding nothing has to be known in advance: the encoder and the decoder
+    grow the same tree symbol by symbol, so no code table is transmitted
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+    
+    def encode(self, data: bytes, chunk_size: int = 1 << 16, record_steps: bool = False) -> bytes:
+        """
+        Encode data in one pass, feeding it to an encoder chunk_size bytes at a time
+        
+        Args:
+            data: Bytes to encode
+            chunk_size: Bytes per feed call, as if they arrived from a stream
+            record_steps: Whether to log every symbol for visualization
+            
+        Returns:
+            Encoded bytes, including the end-of-stream symbol
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        if chunk_size <= 0:  # Check for invalid chunk size
+            raise ValueError("Chunk size must be positive")  # Raise error for empty chunks
+        
+        start_time = time.time()  # Record the start time
+        
+        encoder = AdaptiveHuffmanEncoder(record_steps)  # Fresh stream
+        pieces = [encoder.feed(data[low:low + chunk_size]) for low in range(0, len(data), chunk_size)]  # Encode chunks
+        pieces.append(encoder.flush())  # End the stream
+        encoded = b"".join(pieces)  # Join the pieces once
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        self.operations = encoder.operations  # Nodes updated by the encoder
+        self.steps = encoder.steps  # Per-symbol steps, if recorded
+        self.steps.append(("encode", len(data), len(encoded)))  # Save the encoding sizes
+        
+        return encoded
+    
+    def decode(self, data: bytes, chunk_size: int = 1 << 16, record_steps: bool = False) -> bytes:
+        """
+        Decode data written by encode, feeding it to a decoder chunk_size bytes at a time
+        
+        Args:
+            data: Encoded bytes
+            chunk_size: Bytes per feed call, as if they arrived from a stream
+            record_steps: Whether to log every symbol for visualization
+            
+        Returns:
+            Decoded bytes
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        if chunk_size <= 0:  # Check for invalid chunk size
+            raise ValueError("Chunk size must be positive")  # Raise error for empty chunks
+        
+        start_time = time.time()  # Record the start time
+        
+        decoder = AdaptiveHuffmanDecoder(record_steps)  # Fresh stream
+        pieces = [decoder.feed(data[low:low + chunk_size]) for low in range(0, len(data), chunk_size)]  # Decode chunks
+        pieces.append(decoder.flush())  # Check the stream was complete
+        decoded = b"".join(pieces)  # Join the pieces once
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        self.operations = decoder.operations  # Nodes updated by the decoder
+        self.steps = decoder.steps  # Per-symbol steps, if recorded
+        self.steps.append(("decode", len(data), len(decoded)))  # Save the decoding sizes
+        
+        return decoded
\ No newline at end of file
@@ -0,0 +1,132 @@
+import time  # Import the time module to measure execution time
+from concurrent.futures import ThreadPoolExecutor  # Import a thread pool to split each round over edge slices
+from typing import List, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the vectorized rounds
+
+from algorithms.greedy.kruskal import as_edge_columns  # Import the shared input checks
+
+class Boruvka:
+    """
+    Borůvka's Minimum Spanning Tree algorithm, vectorized with NumPy
+    Every round, each component picks its lightest outgoing edge, all picked edges join the
+    tree at once, and components are merged by pointer jumping. A round is a handful of
+    whole-array operations, and at least halves the number of components, so there are at
+    most log2(V) rounds. Ties are broken by input index, which makes every weight distinct
+    and the tree the same one Kruskal finds.
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+    
+    def find_mst_arrays(self, vertices: int, u, v, w, workers: int = 1) -> List[Tuple[int, int, int]]:
+        """
+        Find the MST of a graph given as (u, v, weight) column arrays
+        
+        Args:
+            vertices: Number of vertices in the graph
+            u, v: Endpoints of every edge
+            w: Weight of every edge
+            workers: Threads sharing the lightest-edge search of each round (1 searches in this thread)
+            
+        Returns:
+            List of edges in the MST, as (u, v, weight) tuples in the order Kruskal adds them
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        u, v, w = as_edge_columns(vertices, u, v, w)  # Check the input
+        if workers <= 0:  # Check for invalid worker count
+            raise ValueError("Number of workers must be positive")  # Raise error for no workers
+        
+        if vertices <= 0:  # Check for invalid input
+            return []  # Return empty list if no vertices
+        
+        self.steps.append(("init", len(w)))  # Save the number of edges
+        
+        start_time = time.time()  # Record the start time
+        
+        component = np.arange(vertices)  # Component label of every vertex (the label is a vertex of it)
+        live = np.arange(len(w))  # Edges that may still join two components
+        chosen = []  # Input indices of the MST edges, one array per round
+        
+        pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None  # Threads for the searches
+        try:
+            while len(live):  # Until no edge joins two components
+                # Drop edges inside a component
+                cu, cv = component[u[live]], component[v[live]]  # Components of both endpoints
+                crossing = cu != cv  # Edges between two components
+                live, cu, cv = live[crossing], cu[crossing], cv[crossing]  # Keep only those
+                self.operations += len(crossing)  # Count each edge looked at as an operation
+                if len(live) == 0:  # Every component is finished
+                    break
+                
+                # Lightest outgoing edge of every component, ties broken by input index
+                best = self._lightest_edges(pool, workers, vertices, len(w), live, cu, cv, w[live])  # Edge per component
+                active = np.flatnonzero(best < len(w))  # Components that have an outgoing edge (len(w) means none)
+                picked = best[active]  # Their lightest edges
+                
+                # Every component points to the component across its edge, a forest of 2-cycles
+                ends_u, ends_v = component[u[picked]], component[v[picked]]  # Components at both ends
+                across = np.where(ends_u == active, ends_v, ends_u)  # The component across each edge
+                successor = np.arange(vertices)  # Components without an edge point to themselves
+                successor[active] = across  # Point across the picked edge
+                mutual = successor[across] == active  # Both ends picked the same edge
+                lower = active < across  # The lower label of such a pair roots its tree
+                successor[active[mutual & lower]] = active[mutual & lower]  # Roots point to themselves
+                chosen.append(picked[~mutual | lower])  # Every picked edge once
+                
+                while True:  # Pointer jumping: follow successors until every one is a root
+                    jumped = successor[successor]  # Two steps at once
+                    if np.array_equal(jumped, successor):  # Every component points to its root
+                        break
+                    successor = jumped
+                component = successor[component]  # Relabel every vertex with its merged component
+                self.steps.append(("round", len(live), len(chosen[-1])))  # Record the edges seen and added
+        finally:
+            if pool is not None:  # Stop the threads
+                pool.shutdown()
+        
+        # Kruskal's order: by weight, equal weights in input order
+        chosen = np.sort(np.concatenate(chosen)) if chosen else np.zeros(0, dtype=np.int64)  # MST edges in input order
+        chosen = chosen[np.argsort(w[chosen], kind="stable")]  # Then by weight
+        mst = list(zip(u[chosen].tolist(), v[chosen].tolist(), w[chosen].tolist()))  # MST edges as tuples
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record final MST
+        self.steps.append(("final", len(mst)))  # Save the size of the final MST
+        
+        return mst  # Return the MST as a list of edges
+    
+    def _lightest_edges(self, pool, workers: int, vertices: int, edge_count: int, live: np.ndarray,
+                        cu: np.ndarray, cv: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Input index of the lightest edge leaving every component, or edge_count for components
+        with none. Both passes are minimum reductions, so every slice of the edges is searched
+        on its own and the partial results are combined with np.minimum
+        """
+        step = -(-len(live) // workers)  # Edges per slice
+        slices = [slice(low, low + step) for low in range(0, len(live), step)]  # One slice per worker
+        run = pool.map if pool is not None else map  # Search the slices in threads or in turn
+        
+        def lightest_weight(part: slice) -> np.ndarray:
+            best = np.full(vertices, weights.max(), dtype=weights.dtype)  # No edge is heavier than the heaviest
+            np.minimum.at(best, cu[part], weights[part])  # Lightest edge at the first endpoint
+            np.minimum.at(best, cv[part], weights[part])  # Lightest edge at the second endpoint
+            return best
+        
+        best_weight = np.minimum.reduce(list(run(lightest_weight, slices)))  # Lightest weight per component
+        
+        def lightest_index(part: slice) -> np.ndarray:
+            best = np.full(vertices, edge_count, dtype=np.int64)  # Components without an edge keep the sentinel
+            for ends in (cu[part], cv[part]):  # Both endpoints
+                lightest = weights[part] == best_weight[ends]  # Edges as light as the lightest of their component
+                np.minimum.at(best, ends[lightest], live[part][lightest])  # Lowest input index among them
+            return best
+        
+        return np.minimum.reduce(list(run(lightest_index, slices)))  # Lightest edge per component
\ No newline at end of file
@@ -1,12 +1,115 @@
 import time  # Import the time module to measure execution time
-from typing import List, Tuple  # Import type hints for better code documentation
+from collections import OrderedDict  # Import OrderedDict for the LRU of precomputed tables
+from typing import Iterable, List, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the vectorized DP engine
+
+class CoinChangeTable:
+    """
+    Minimum-coin DP table for one denomination set, shared by many queries
+    The table is built once, grows when a larger amount is asked for, and
+    answers coin counts in O(1) and coin lists in O(coins used)
+    """
+    
+    SENTINEL = 2 ** 62  # Coin count of unreachable amounts, far above any real count
+    
+    def __init__(self, coins: List[int]):
+        if any(coin <= 0 for coin in coins):  # Check for invalid denominations
+            raise ValueError("Coin denominations must be positive")  # Raise error for invalid coins
+        self.coins = sorted(set(coins))  # Distinct denominations, smallest first
+        self.operations = 0  # Counter for number of table cells computed
+        self.dp = np.zeros(1, dtype=np.int64)  # Minimum coins for each amount, dp[0] = 0
+        self.last_coin = np.zeros(1, dtype=np.int64)  # Coin used last for each amount (0 if none)
+    
+    @property
+    def max_amount(self) -> int:
+        """Largest amount the table currently covers"""
+        return len(self.dp) - 1
+    
+    def extend(self, amount: int):
+        """
+        Make sure the table covers amount
+        The table at least doubles when it grows, so growing one amount at a time stays linear
+        """
+        old_size = len(self.dp)  # Amounts already solved
+        if amount < old_size:  # Already covered
+            return
+        new_size = max(amount + 1, 2 * old_size)  # Grow geometrically
+        
+        dp = np.full(new_size, self.SENTINEL, dtype=np.int64)  # Extended table, new amounts unreachable so far
+        dp[:old_size] = self.dp  # Solved amounts are final
+        last_coin = np.zeros(new_size, dtype=np.int64)  # Extended last-coin table
+        last_coin[:old_size] = self.last_coin  # Keep the solved entries
+        
+        for coin in self.coins:  # One vectorized pass per coin, as in dp_coin_change_vectorized
+            if coin >= new_size:  # Too large for every amount in the table (coins are sorted, so all the rest are too)
+                break
+            # Solved amounts are optimal, so the last coin-sized block of them is all the
+            # history a residue class needs; a coin that just became usable needs the whole
+            # table, whose first coin amounts are its base row
+            start = max(old_size - coin, 0)  # First amount of the window
+            length = new_size - start  # Amounts in the window
+            rows = -(-length // coin)  # Rows of the (rows, coin) grid
+            self.operations += length  # Count every amount touched by this pass
+            
+            grid = np.full(rows * coin, self.SENTINEL, dtype=np.int64)  # Padded copy of the window
+            grid[:length] = dp[start:]  # Copy the window in
+            grid = grid.reshape(rows, coin)  # Each column is one residue class
+            offsets = np.arange(rows, dtype=np.int64)[:, None]  # j for every row
+            grid -= offsets  # dp[r + jc] - j
+            np.minimum.accumulate(grid, axis=0, out=grid)  # Best starting point i <= j in each class
+            grid += offsets  # Back to coin counts
+            
+            updated = grid.ravel()[:length]  # New values for the window
+            np.putmask(last_coin[start:], updated < dp[start:], coin)  # Remember the coin where it helped
+            dp[start:] = updated  # Store the new values
+        
+        self.dp = dp  # Swap in the extended tables
+        self.last_coin = last_coin
+    
+    def min_coins(self, amount: int) -> int:
+        """Minimum number of coins for amount, or -1 if it cannot be made"""
+        if amount < 0:  # Check for invalid amount
+            raise ValueError("Amount must be non-negative")  # Raise error for negative amount
+        self.extend(amount)  # Grow the table if needed
+        count = int(self.dp[amount])  # O(1) lookup
+        return -1 if count >= self.SENTINEL else count
+    
+    def min_coins_many(self, amounts: Iterable[int]) -> np.ndarray:
+        """Minimum number of coins for every amount at once (-1 where impossible)"""
+        amounts = np.asarray(list(amounts) if not isinstance(amounts, np.ndarray) else amounts, dtype=np.int64)  # Query amounts
+        if (amounts < 0).any():  # Check for invalid amounts
+            raise ValueError("Amounts must be non-negative")  # Raise error for negative amounts
+        if amounts.size:  # Nothing to extend for an empty query
+            self.extend(int(amounts.max()))  # One growth covers the whole batch
+        counts = self.dp[amounts]  # Vectorized lookup
+        return np.where(counts >= self.SENTINEL, -1, counts)  # Mark impossible amounts
+    
+    def coins_for(self, amount: int) -> List[int]:
+        """Coins of one optimal solution for amount, or [] if it cannot be made"""
+        if amount < 0:  # Check for invalid amount
+            raise ValueError("Amount must be non-negative")  # Raise error for negative amount
+        if self.min_coins(amount) < 0:  # Check reachability (and grow the table)
+            return []
+        result = []  # Coins used, in backtracking order
+        remaining = amount  # Start with the full amount
+        while remaining > 0:  # Follow the last-coin chain
+            coin = int(self.last_coin[remaining])  # Coin used last for this amount
+            result.append(coin)  # Add the coin to result
+            remaining -= coin  # Reduce the remaining amount
+        return result
 
 class CoinChange:
     """
     Implementation of the Coin Change problem with greedy and dynamic programming approaches
     """
     
+    TABLE_CACHE_SIZE = 8  # Precomputed DP tables kept by table(), least recently used evicted first
+    MAX_MODULUS = 2 ** 56  # count_ways_mod moduli stay below this, so every reduction block has at least 255 rows
+    
     def __init__(self):
+        self.canonical_cache = {}  # Canonicity verdicts keyed by denomination set, kept across resets
+        self.tables = OrderedDict()  # LRU of CoinChangeTable objects keyed by denomination set
         self.reset()  # Initialize the object by calling the reset method
     
     def reset(self):
@@ -14,6 +117,7 @@ class CoinChange:
         self.operations = 0  # Counter for number of operations performed
         self.execution_time = 0  # Tracker for execution time
         self.steps = []  # List to store computation steps for visualization
+        self.strategy = ""  # Engine chosen by the last solve call ("greedy" or "dp")
     
     def greedy_coin_change(self, coins: List[int], amount: int) -> Tuple[int, List[int]]:
         """
@@ -102,6 +206,252 @@ class CoinChange:
         
         return dp[amount], result  # Return minimum number of coins and the coins list
     
+    def dp_coin_change_vectorized(self, coins: List[int], amount: int,
+                                  record_steps: bool = False) -> Tuple[int, List[int]]:
+        """
+        Solves the coin change problem with the same DP as dp_coin_change, but
+        processes one coin per vectorized pass over an integer array:
+        - For coin c, along each residue class a = r, r + c, r + 2c, ...
+          the unbounded-coin recurrence dp[a] = min(dp[a], dp[a - c] + 1)
+          unrolls to dp'[r + jc] = j + min over i <= j of (dp[r + ic] - i),
+          which is a running minimum
+        - Unreachable amounts hold the sentinel amount + 1 instead of infinity
+        - Steps are only recorded when record_steps is True, and then only
+          one entry per coin pass and per coin used
+        
+        Returns (num_coins, selected_coins)
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        
+        if any(coin <= 0 for coin in coins):  # Check for invalid denominations
+            raise ValueError("Coin denominations must be positive")  # Raise error for invalid coins
+        if amount < 0:  # Check for invalid amount
+            raise ValueError("Amount must be non-negative")  # Raise error for negative amount
+        
+        usable = sorted({coin for coin in coins if coin <= amount})  # Distinct coins that can be used at all
+        dtype = np.int32 if amount < 2 ** 30 else np.int64  # Smallest type that holds the sentinel and offsets
+        sentinel = amount + 1  # More coins than any real solution needs
+        
+        # One buffer serves every pass: amounts past the target only ever sit at the
+        # end of their residue class, so whatever they hold never flows back into dp
+        buffer = np.full(amount + 1 + (usable[-1] if usable else 0), sentinel, dtype=dtype)  # dp plus padding
+        buffer[0] = 0  # Base case: 0 coins needed to make amount 0
+        dp = buffer[:amount + 1]  # Minimum coins for each amount (a view into the buffer)
+        
+        if record_steps:  # Only log when asked to
+            self.steps.append(("init", usable, amount))  # Record initial state
+        
+        start_time = time.time()  # Record the start time
+        
+        for coin in usable:  # One vectorized pass per coin
+            self.operations += amount + 1  # Count every amount touched by this pass
+            before = dp.copy() if record_steps else None  # Only needed to count improvements
+            grid = self._residue_grid(buffer, amount, coin)  # One column per residue class
+            offsets = np.arange(grid.shape[0], dtype=dtype)[:, None]  # j for every row
+            
+            grid -= offsets  # dp[r + jc] - j
+            np.minimum.accumulate(grid, axis=0, out=grid)  # Best starting point i <= j in each class
+            grid += offsets  # Back to coin counts
+            
+            if record_steps:  # Only log when asked to
+                self.steps.append(("pass", coin, int(np.count_nonzero(dp < before))))  # Record how many amounts improved
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # No solution exists
+        if dp[amount] >= sentinel:  # If we couldn't reach the target amount
+            return -1, []  # Return -1 to indicate no solution found
+        
+        # Backtrack to find the coins used, one run of equal coins at a time
+        result = []  # Initialize list to store selected coins
+        remaining = amount  # Start with the full amount
+        largest_first = usable[::-1]  # Large coins reach the base case in fewer steps
+        while remaining > 0:  # Continue until all amount is accounted for
+            count = int(dp[remaining])  # Coins still needed
+            coin = next(c for c in largest_first if c <= remaining and dp[remaining - c] == count - 1)  # Coin on an optimal path
+            run = self._optimal_run(dp, remaining, coin, count)  # How many copies of it stay optimal
+            result.extend([coin] * run)  # Add the coins to result
+            remaining -= coin * run  # Reduce the remaining amount
+            if record_steps:  # Only log when asked to
+                self.steps.append(("backtrack_run", coin, run, remaining))  # Record the backtracking step
+        
+        return int(dp[amount]), result  # Return minimum number of coins and the coins list
+    
+    def count_ways(self, coins: List[int], amount: int, record_steps: bool = False) -> int:
+        """
+        Counts the combinations of coins (order ignored) that make amount, exactly
+        Uses the classic 1-D DP ways[a] += ways[a - c], one vectorized pass per coin:
+        along each residue class the pass is a running sum
+        """
+        return self._count_ways(coins, amount, None, record_steps)  # Exact big-int mode
+    
+    def count_ways_mod(self, coins: List[int], amount: int, modulus: int, record_steps: bool = False) -> int:
+        """
+        Counts the combinations of coins that make amount, modulo modulus
+        Works on uint64 arrays, so it is much faster than count_ways for large amounts;
+        moduli below 2^32 let each pass run as one cumsum, larger ones need shorter blocks
+        (at least 255 rows up to MAX_MODULUS, where one Python step per block stays cheap)
+        """
+        if not 1 <= modulus < self.MAX_MODULUS:  # Larger moduli would shrink the blocks to a row or two
+            raise ValueError("Modulus must be between 1 and 2^56 - 1")  # Raise error for unsupported modulus
+        return self._count_ways(coins, amount, modulus, record_steps)  # Modular uint64 mode
+    
+    def _count_ways(self, coins: List[int], amount: int, modulus, record_steps: bool) -> int:
+        """Shared engine for count_ways (modulus None, object array) and count_ways_mod (uint64 array)"""
+        self.reset()  # Reset all metrics before starting the algorithm
+        
+        if any(coin <= 0 for coin in coins):  # Check for invalid denominations
+            raise ValueError("Coin denominations must be positive")  # Raise error for invalid coins
+        if amount < 0:  # Check for invalid amount
+            raise ValueError("Amount must be non-negative")  # Raise error for negative amount
+        
+        usable = sorted({coin for coin in coins if coin <= amount})  # Distinct coins that can be used at all
+        
+        # Padded buffer, as in dp_coin_change_vectorized: amounts past the target never flow back
+        size = amount + 1 + (usable[-1] if usable else 0)  # Amounts plus padding
+        if modulus is None:  # Exact mode keeps Python integers
+            buffer = np.zeros(size, dtype=object)  # Object array of exact counts
+            buffer[:] = 0  # Python int zeros rather than None
+        else:
+            buffer = np.zeros(size, dtype=np.uint64)  # Counts modulo modulus
+        buffer[0] = 1 % (modulus or 2)  # One way to make 0: take nothing
+        
+        if record_steps:  # Only log when asked to
+            self.steps.append(("init", usable, amount))  # Record initial state
+        
+        start_time = time.time()  # Record the start time
+        
+        for coin in usable:  # One vectorized pass per coin
+            self.operations += amount + 1  # Count every amount touched by this pass
+            grid = self._residue_grid(buffer, amount, coin)  # One column per residue class
+            if modulus is None:
+                np.cumsum(grid, axis=0, out=grid)  # Running sums with exact integers
+            else:
+                self._cumsum_mod(grid, modulus)  # Running sums without overflowing uint64
+            if record_steps:  # Only log when asked to
+                self.steps.append(("pass", coin, buffer[amount]))  # Record the count so far
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        return int(buffer[amount])  # Number of combinations (mod modulus)
+    
+    def _cumsum_mod(self, grid: np.ndarray, modulus: int):
+        """
+        In-place running sum down the rows of a uint64 grid, modulo modulus
+        Rows are summed in blocks small enough that the partial sums cannot overflow
+        """
+        mod = np.uint64(modulus)  # Modulus as a NumPy scalar
+        block = max((2 ** 64 - 1) // modulus - 1, 1)  # Terms below modulus that fit in one sum, plus the carry
+        for start in range(0, grid.shape[0], block):  # For each block of rows
+            rows = grid[start:start + block]  # View of the block
+            if start:  # Carry the last reduced row of the previous block in
+                rows[0] += grid[start - 1]
+            np.cumsum(rows, axis=0, out=rows)  # Running sum inside the block
+            rows %= mod  # Reduce the block
+    
+    def _residue_grid(self, buffer: np.ndarray, amount: int, coin: int) -> np.ndarray:
+        """
+        View amounts 0..amount of a padded buffer as a (rows, coin) grid:
+        row j, column r holds amount r + j * coin, so each column is one residue class
+        The buffer must have at least coin - 1 entries of padding after amount
+        """
+        rows = -(-(amount + 1) // coin)  # Number of multiples of coin covering 0..amount
+        return buffer[:rows * coin].reshape(rows, coin)  # View, no copy
+    
+    def _optimal_run(self, dp: np.ndarray, remaining: int, coin: int, count: int) -> int:
+        """
+        Largest k such that taking k copies of coin from remaining stays optimal,
+        i.e. dp[remaining - k * coin] == count - k
+        The valid k form a prefix 1..K, so K is found by galloping and binary search
+        """
+        def optimal(k: int) -> bool:
+            return k * coin <= remaining and dp[remaining - k * coin] == count - k  # k copies stay on an optimal path
+        
+        good, bad = 1, 2  # One copy is known to be optimal
+        while optimal(bad):  # Gallop until a count fails
+            good, bad = bad, bad * 2  # Double the probe
+        while bad - good > 1:  # Binary search between the last success and the first failure
+            mid = (good + bad) // 2  # Middle count
+            if optimal(mid):  # If mid copies are still optimal
+                good = mid  # The answer is at least mid
+            else:
+                bad = mid  # The answer is below mid
+        return good
+    
+    def is_canonical(self, coins: List[int]) -> bool:
+        """
+        Check whether the greedy algorithm is optimal for every amount with these coins,
+        using Pearson's O(n^3) test: the smallest counterexample, if one exists, is
+        built from the greedy representation of some c[i-1] - 1 (coins in descending
+        order) by keeping its first j - 1 entries and adding one coin c[j]
+        
+        Results are cached per denomination set
+        """
+        key = frozenset(coins)  # Order and duplicates don't matter
+        if key in self.canonical_cache:  # If this system was tested before
+            return self.canonical_cache[key]
+        
+        desc = sorted(key, reverse=True)  # Coins from largest to smallest
+        if not desc or desc[-1] != 1:  # Without a 1 coin greedy can miss amounts DP can make
+            canonical = False
+        else:
+            canonical = True  # Assume canonical until a counterexample is found
+            for i in range(1, len(desc)):  # For every coin but the largest
+                greedy = self._greedy_counts(desc, desc[i - 1] - 1)  # Greedy representation of c[i-1] - 1
+                for j in range(i, len(desc)):  # For every coin from c[i] down
+                    self.operations += 1  # Count each candidate as an operation
+                    candidate = greedy[:j] + [greedy[j] + 1]  # Keep the first j entries, add one c[j]
+                    value = sum(count * coin for count, coin in zip(candidate, desc))  # Amount it represents
+                    if sum(self._greedy_counts(desc, value)) > sum(candidate):  # Greedy uses more coins than the candidate
+                        canonical = False  # Found a counterexample
+                        break
+                if not canonical:  # Stop at the first counterexample
+                    break
+        
+        self.canonical_cache[key] = canonical  # Cache the verdict
+        return canonical
+    
+    def _greedy_counts(self, desc: List[int], amount: int) -> List[int]:
+        """Number of each coin (largest first) the greedy algorithm takes for amount"""
+        counts = []  # Count per coin
+        for coin in desc:  # From the largest coin down
+            count, amount = divmod(amount, coin)  # Take as many as fit
+            counts.append(count)  # Record the count
+        return counts
+    
+    def solve(self, coins: List[int], amount: int) -> Tuple[int, List[int]]:
+        """
+        Solves the coin change problem with the cheapest engine that is still optimal:
+        - Greedy (O(k)) when the coin system is canonical
+        - The vectorized DP otherwise
+        
+        The chosen engine is stored in self.strategy
+        Returns (num_coins, selected_coins)
+        """
+        canonical = self.is_canonical(coins)  # Cached after the first call per denomination set
+        if canonical:  # Greedy is provably optimal
+            result = self.greedy_coin_change(coins, amount)  # Run the greedy engine
+        else:
+            result = self.dp_coin_change_vectorized(coins, amount)  # Fall back to the DP engine
+        self.strategy = "greedy" if canonical else "dp"  # Remember which engine answered
+        return result
+    
+    def table(self, coins: List[int]) -> CoinChangeTable:
+        """
+        Return the shared DP table for these denominations, for answering many amounts
+        Tables live in an LRU keyed by denomination set
+        """
+        key = tuple(sorted(set(coins)))  # Order and duplicates don't matter
+        if key in self.tables:  # If the table was built before
+            self.tables.move_to_end(key)  # Mark it as most recently used
+            return self.tables[key]
+        
+        table = CoinChangeTable(list(key))  # Build a new, empty table
+        self.tables[key] = table  # Add it to the cache
+        if len(self.tables) > self.TABLE_CACHE_SIZE:  # If the cache is full
+            self.tables.popitem(last=False)  # Evict the least recently used table
+        return table
+    
     def compare_approaches(self, coins: List[int], amount: int) -> dict:
         """Compare greedy and DP approaches for coin change problem"""
         # Run greedy approach
@@ -121,6 +471,7 @@ class CoinChange:
         }
         
         return {  # Return results and metrics from both approaches
+            "canonical": self.is_canonical(coins),  # Whether greedy is optimal for every amount
             "greedy": {
                 "count": greedy_count,
                 "coins": greedy_coins,
@@ -0,0 +1,109 @@
+import time  # Import the time module to measure execution time
+from typing import List, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for partitioning and filtering edges
+
+from algorithms.greedy.kruskal import DisjointSet, as_edge_columns  # Import the shared union-find and input checks
+
+class FilterKruskal:
+    """
+    Filter-Kruskal Minimum Spanning Tree algorithm
+    Instead of sorting every edge up front, edges are split around a pivot weight like in
+    quicksort. The light half is solved first; the heavy half is then filtered, dropping
+    edges whose endpoints the light half already connected, before it is split in turn.
+    Only small pieces are sorted and fed to the union-find, and heavy edges of dense graphs
+    are mostly discarded in bulk without ever being sorted.
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+    
+    def find_mst_arrays(self, vertices: int, u, v, w, base_size: int = 1 << 14) -> List[Tuple[int, int, int]]:
+        """
+        Find the MST of a graph given as (u, v, weight) column arrays
+        
+        Args:
+            vertices: Number of vertices in the graph
+            u, v: Endpoints of every edge
+            w: Weight of every edge
+            base_size: Pieces with at most this many edges are sorted and run through Kruskal
+            
+        Returns:
+            List of edges in the MST, as (u, v, weight) tuples in the order Kruskal adds them
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        u, v, w = as_edge_columns(vertices, u, v, w)  # Check the input
+        if base_size <= 0:  # Check for invalid piece size
+            raise ValueError("Base size must be positive")  # Raise error for empty pieces
+        
+        if vertices <= 0:  # Check for invalid input
+            return []  # Return empty list if no vertices
+        
+        self.steps.append(("init", len(w)))  # Save the number of edges
+        
+        start_time = time.time()  # Record the start time
+        
+        ds = DisjointSet(vertices)  # Union-find shared by every piece
+        parent = np.frombuffer(ds.parent, dtype=np.dtype(ds.parent.typecode))  # NumPy view of its parent array
+        union = ds.union  # Bound method, looked up once
+        chosen = []  # Input indices of the MST edges, in the order they are added
+        needed = vertices - 1  # Edges of a spanning tree
+        
+        # Pieces still to solve, lightest on top; a piece is (edge indices, whether to filter it first)
+        stack = [(np.arange(len(w)), False)]  # Start with every edge
+        while stack and len(chosen) < needed:  # Stop as soon as the tree is complete
+            piece, stale = stack.pop()  # Lightest piece left
+            if stale:  # Lighter edges were added since this piece was split off
+                self.operations += len(piece)  # Count each filtered edge as an operation
+                ru, rv = self._roots(parent, u[piece]), self._roots(parent, v[piece])  # Components of both endpoints
+                kept = piece[ru != rv]  # Edges that still join two components
+                self.steps.append(("filter", len(piece), len(kept)))  # Record how many edges survived
+                piece = kept
+                if len(piece) == 0:  # Nothing left of this piece
+                    continue
+            
+            weights = w[piece]  # Weights of the piece
+            if len(piece) > base_size:  # Large pieces are split around a pivot weight
+                sample = np.sort(weights[::max(len(piece) // 1024, 1)])  # Evenly spaced sample of the weights
+                pivot = sample[len(sample) // 2]  # Its median, an actual weight of the piece
+                light = weights <= pivot  # Edges on the light side
+                self.operations += len(piece)  # Count each partitioned edge as an operation
+                if not light.all():  # Both sides are non-empty (the median is never below the minimum)
+                    self.steps.append(("partition", pivot.item(), int(light.sum()), len(piece)))  # Record the split
+                    stack.append((piece[~light], True))  # Heavy side, filtered once the light side is done
+                    stack.append((piece[light], False))  # Light side first
+                    continue
+            
+            # Small piece, or every weight equals the pivot: plain Kruskal over the sorted piece
+            piece = piece[np.argsort(weights, kind="stable")]  # The piece by weight, equal weights in input order
+            for index, x, y in zip(piece.tolist(), u[piece].tolist(), v[piece].tolist()):
+                self.operations += 1  # Count each edge consideration as an operation
+                if union(x, y):  # If x and y were in different sets (no cycle is created)
+                    chosen.append(index)  # Add edge to MST
+                    if len(chosen) == needed:  # If we have v-1 edges, MST is complete
+                        break  # Exit the loop early
+        
+        del parent  # Release the view of the union-find
+        mst = list(zip(u[chosen].tolist(), v[chosen].tolist(), w[chosen].tolist()))  # MST edges as tuples
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record final MST
+        self.steps.append(("final", len(mst)))  # Save the size of the final MST
+        
+        return mst  # Return the MST as a list of edges
+    
+    def _roots(self, parent: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """Find the union-find root of every node at once by following parents until none move"""
+        roots = parent[nodes]  # One step up
+        while True:
+            above = parent[roots]  # One more step up
+            if np.array_equal(above, roots):  # Every node has reached its root
+                return roots
+            roots = above
\ No newline at end of file
@@ -0,0 +1,212 @@
+import mmap  # Import mmap to count byte frequencies without reading files into memory
+import os  # Import os to get file sizes
+import struct  # Import struct for the fixed-size part of the file header
+import time  # Import the time module to measure execution time
+from concurrent.futures import ProcessPoolExecutor  # Import a process pool to encode and decode blocks in parallel
+from typing import Iterator, List, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the vectorized frequency pass
+
+from algorithms.greedy.huffman_coding import HuffmanCoding  # Import the canonical Huffman codec
+
+MAGIC = b"HUFB"  # First bytes of every compressed file
+FILE_HEADER = struct.Struct("<4sQQ")  # Magic, original size and block size
+MAX_CODE_HEADER = 1 << 12  # A code header for 256 byte values is always shorter than this
+
+_worker_codec = None  # Codec of a pool worker process, loaded once by _init_worker
+
+def _init_worker(code_header: bytes):
+    """Load the shared canonical codes once in every worker process"""
+    global _worker_codec
+    _worker_codec = HuffmanCoding()  # Codec private to this process
+    _worker_codec.load_code_header(code_header)  # Same codes as the parent
+
+def _run_in_worker(task: Tuple) -> bytes:
+    """Run (function, *args) with the worker's codec"""
+    function, *args = task  # Block function and its arguments
+    return function(_worker_codec, *args)
+
+def _encode_block(codec: HuffmanCoding, path: str, start: int, stop: int) -> bytes:
+    """Encode bytes [start, stop) of a file, each byte being the character with that code point"""
+    with open(path, "rb") as file:  # Open the input file
+        file.seek(start)  # Go to the block
+        chunk = file.read(stop - start)  # Read just this block
+    packed, _ = codec.encode_packed(chunk.decode("latin-1"))  # Latin-1 maps bytes 0-255 to characters 0-255
+    codec.steps.clear()  # Don't let per-block steps pile up
+    return packed
+
+def _decode_block(codec: HuffmanCoding, path: str, offset: int, bit_length: int, size: int,
+                  table_bits: int) -> bytes:
+    """Decode one block of a compressed file back to its size original bytes"""
+    with open(path, "rb") as file:  # Open the compressed file
+        file.seek(offset)  # Go to the block
+        data = file.read((bit_length + 7) // 8)  # Read just this block
+    text = codec.decode_packed(data, bit_length, table_bits)  # Decode with fixed-width tables
+    codec.steps.clear()  # Don't let per-block steps pile up
+    if len(text) != size:  # The block table and the data disagree
+        raise ValueError("Compressed block does not decode to its recorded size")  # Raise error for corrupt files
+    return text.encode("latin-1")  # Back to bytes
+
+class HuffmanFileCompressor:
+    """
+    File compressor built on canonical Huffman codes over byte values
+    A first pass counts byte frequencies block by block over a memory-mapped file. The
+    codes built from the totals are shared by all blocks, and every block is encoded on
+    its own, so blocks can be encoded and decoded in parallel by a process pool.
+    
+    File layout: magic, original size, block size, the code-length header of
+    HuffmanCoding.code_header, the bit length of every block (little-endian 64-bit
+    integers), then the blocks, each padded to a whole byte
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+        self.codec = HuffmanCoding()  # Canonical codes of the last file
+    
+    def compress_file(self, source: str, destination: str, block_size: int = 1 << 22,
+                      max_length: int = 15, workers: int = 1) -> int:
+        """
+        Compress a file of any size
+        
+        Args:
+            source: Path of the file to compress
+            destination: Path of the compressed file to write
+            block_size: Bytes per independently coded block
+            max_length: Longest code allowed, in bits
+            workers: Processes encoding blocks (1 encodes in this process)
+            
+        Returns:
+            Size of the compressed file in bytes
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        if block_size <= 0:  # Check for invalid block size
+            raise ValueError("Block size must be positive")  # Raise error for empty blocks
+        if workers <= 0:  # Check for invalid worker count
+            raise ValueError("Number of workers must be positive")  # Raise error for no workers
+        
+        start_time = time.time()  # Record the start time
+        
+        # First pass: byte frequencies of every block, then the shared codes
+        counts = self._count_blocks(source, block_size)  # One row of 256 counts per block
+        totals = counts.sum(axis=0)  # Frequency of every byte value
+        size = int(totals.sum())  # Size of the input file
+        self.codec.build_canonical_codes_from_frequencies(
+            {chr(byte): count for byte, count in enumerate(totals.tolist())}, max_length)  # Shared canonical codes
+        self.steps.append(("codes", self.codec.codes.copy()))  # Save the codes
+        
+        # The bits of every block are known before encoding it, so the header comes first
+        lengths = np.zeros(256, dtype=np.int64)  # Code length of every byte value
+        for char, code in self.codec.codes.items():
+            lengths[ord(char)] = len(code)
+        block_bits = counts @ lengths  # Bits of every block
+        code_header = self.codec.code_header(int(block_bits.sum()))  # Code lengths and the total bit count
+        
+        # Second pass: encode the blocks in order, possibly in parallel
+        tasks = [(_encode_block, source, low, min(low + block_size, size)) for low in range(0, size, block_size)]
+        with open(destination, "wb") as out:  # Write the compressed file
+            out.write(FILE_HEADER.pack(MAGIC, size, block_size))  # Fixed-size part of the header
+            out.write(code_header)  # Canonical codes
+            out.write(block_bits.astype("<u8").tobytes())  # Block table
+            for index, packed in enumerate(self._run_tasks(tasks, code_header, workers)):  # Blocks in order
+                out.write(packed)  # Append the block
+                self.operations += tasks[index][3] - tasks[index][2]  # Count each encoded byte as an operation
+                self.steps.append(("block", index, int(block_bits[index])))  # Record the block size in bits
+            compressed_size = out.tell()  # Size of the compressed file
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record compression
+        self.steps.append(("compress_file", size, compressed_size))  # Save the file sizes
+        
+        return compressed_size  # Return the compressed size
+    
+    def decompress_file(self, source: str, destination: str, workers: int = 1) -> int:
+        """
+        Decompress a file written by compress_file
+        
+        Args:
+            source: Path of the compressed file
+            destination: Path of the file to restore
+            workers: Processes decoding blocks (1 decodes in this process)
+            
+        Returns:
+            Size of the restored file in bytes
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        if workers <= 0:  # Check for invalid worker count
+            raise ValueError("Number of workers must be positive")  # Raise error for no workers
+        
+        start_time = time.time()  # Record the start time
+        
+        # Parse the header: sizes, codes and block table
+        with open(source, "rb") as file:  # Open the compressed file
+            head = file.read(FILE_HEADER.size + MAX_CODE_HEADER)  # Everything up to the block table
+            if len(head) < FILE_HEADER.size or head[:4] != MAGIC:  # Check the magic
+                raise ValueError("Not a Huffman compressed file")  # Raise error for foreign files
+            _, size, block_size = FILE_HEADER.unpack_from(head)  # Original size and block size
+            total_bits, header_size = self.codec.load_code_header(head[FILE_HEADER.size:])  # Shared codes
+            if any(ord(char) > 255 for char in self.codec.codes):  # Only byte values can be coded
+                raise ValueError("Compressed file codes characters outside the byte range")  # Raise error for bad codes
+            if size and (block_size <= 0 or not self.codec.codes):  # Blocks need a size and codes
+                raise ValueError("Compressed file header is inconsistent")  # Raise error for bad headers
+            
+            table_start = FILE_HEADER.size + header_size  # Position of the block table
+            blocks = -(-size // block_size) if size else 0  # Number of blocks
+            file.seek(table_start)  # Go to the block table
+            table = file.read(8 * blocks)  # Bit length of every block
+            if len(table) != 8 * blocks:  # The table is cut short
+                raise ValueError("Truncated block table")  # Raise error for short files
+            block_bits = np.frombuffer(table, dtype="<u8").astype(np.int64)  # Bit length of every block
+            file.seek(0, os.SEEK_END)  # Check the total size of the file
+            file_size = file.tell()
+        
+        offsets = table_start + 8 * blocks + np.concatenate(([0], np.cumsum((block_bits + 7) // 8)))  # Block positions
+        if int(block_bits.sum()) != total_bits or int(offsets[-1]) != file_size:  # Table, header and file must agree
+            raise ValueError("Compressed file size does not match its block table")  # Raise error for corrupt files
+        
+        table_bits = min(max(max(map(len, self.codec.codes.values()), default=1), 12), 24)  # Fixed-width tables
+        code_header = head[FILE_HEADER.size:table_start]  # Codes for the workers
+        tasks = [(_decode_block, source, int(offsets[index]), int(block_bits[index]),
+                  min(block_size, size - index * block_size), table_bits) for index in range(blocks)]
+        with open(destination, "wb") as out:  # Write the restored file
+            for index, chunk in enumerate(self._run_tasks(tasks, code_header, workers)):  # Blocks in order
+                out.write(chunk)  # Append the block
+                self.operations += len(chunk)  # Count each decoded byte as an operation
+                self.steps.append(("block", index, len(chunk)))  # Record the block size
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record decompression
+        self.steps.append(("decompress_file", file_size, size))  # Save the file sizes
+        
+        return size  # Return the restored size
+    
+    def _count_blocks(self, path: str, block_size: int) -> np.ndarray:
+        """Count the byte values of every block of a file with np.bincount over a memory map"""
+        size = os.path.getsize(path)  # Size of the file
+        counts = np.zeros((-(-size // block_size), 256), dtype=np.int64)  # One row per block
+        if size == 0:  # Empty files cannot be memory-mapped
+            return counts
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = np.frombuffer(mapped, dtype=np.uint8)  # The file as an array, paged in on demand
+            for index in range(len(counts)):  # Count one block at a time
+                counts[index] = np.bincount(data[index * block_size:(index + 1) * block_size], minlength=256)
+            del data  # Release the map before closing it
+        self.operations += size  # Count each byte as an operation
+        return counts
+    
+    def _run_tasks(self, tasks: List[Tuple], code_header: bytes, workers: int) -> Iterator[bytes]:
+        """Run (function, *args) block tasks with the shared codes, yielding results in order"""
+        if workers == 1 or len(tasks) <= 1:  # Not worth starting processes
+            for function, *args in tasks:
+                yield function(self.codec, *args)
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(code_header,)) as pool:  # Workers load the codes once
+            yield from pool.map(_run_in_worker, tasks)
\ No newline at end of file
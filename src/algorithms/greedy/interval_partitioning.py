@@ -0,0 +1,148 @@
+import time  # Import the time module to measure execution time
+import heapq  # Import the heapq module for the min-heap of resource end times
+from typing import List, Sequence, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the sweep-line variants
+
+class IntervalPartitioning:
+    """
+    Implementation of the Interval Partitioning problem (minimum number of resources,
+    e.g. rooms, so that no two overlapping activities share one) using greedy algorithms
+    Activities are half-open [start, end), so one may start exactly when another ends
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+        self.peak_concurrency = 0  # Largest number of activities running at the same time
+    
+    def partition(self, start_times: Sequence[int], end_times: Sequence[int]) -> List[int]:
+        """
+        Assign every activity to a resource using as few resources as possible.
+        The greedy approach processes activities by start time and reuses the resource
+        that frees up earliest, kept at the top of a min-heap of end times.
+        
+        Args:
+            start_times: List of activity start times
+            end_times: List of activity end times
+        
+        Returns:
+            Resource number for each activity (in input order)
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        n = self._validate(start_times, end_times)  # Check the input
+        
+        order = sorted(range(n), key=lambda i: start_times[i])  # Activities by start time
+        self.steps.append(("init", n))  # Record the number of activities
+        
+        start_time = time.time()  # Record the start time
+        
+        assignment = [0] * n  # Resource of each activity
+        heap = []  # (end time, resource) of every resource in use
+        for index in order:  # Iterate through activities by start time
+            self.operations += 1  # Count each activity as an operation
+            start, end = start_times[index], end_times[index]  # Current activity
+            if heap and heap[0][0] <= start:  # If the earliest-free resource is free by now
+                resource = heap[0][1]  # Reuse it
+                heapq.heapreplace(heap, (end, resource))  # It is now busy until this activity ends
+                self.steps.append(("reuse", index, resource))  # Record reusing a resource
+            else:
+                resource = len(heap)  # Every resource is busy, open a new one
+                heapq.heappush(heap, (end, resource))  # It is busy until this activity ends
+                self.steps.append(("open", index, resource))  # Record opening a resource
+            assignment[index] = resource  # Remember the assignment
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Resources are never released from the heap, so its size is the number opened
+        self.peak_concurrency = len(heap)  # The greedy uses exactly peak-concurrency resources
+        self.steps.append(("final", self.peak_concurrency))  # Save final state
+        
+        return assignment  # Return the resource of each activity
+    
+    def partition_sweep(self, start_times: Sequence[int], end_times: Sequence[int]) -> np.ndarray:
+        """
+        Sweep-line variant of partition for very large inputs.
+        All start and end events are sorted at once with NumPy (ends before starts at
+        equal times), then a single pass hands out resources from a stack of free ones.
+        
+        Returns:
+            Resource number for each activity (in input order) as an array
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        starts, ends = self._as_arrays(start_times, end_times)  # Check the input
+        n = len(starts)  # Number of activities
+        
+        start_time = time.time()  # Record the start time
+        
+        # Event i < n is the end of activity i, event n + i is the start of activity i
+        times = np.concatenate((ends, starts))  # Time of every event
+        kinds = np.concatenate((np.zeros(n, dtype=np.int8), np.ones(n, dtype=np.int8)))  # 0 = end, 1 = start
+        events = np.lexsort((kinds, times))  # By time, ends first on ties
+        self.operations += 2 * n  # Count every event as an operation
+        
+        assignment = [0] * n  # Resource of each activity
+        free = []  # Resources that are currently free
+        opened = 0  # Resources opened so far
+        for event in events.tolist():  # Walk the events in order
+            if event >= n:  # Start of activity event - n
+                if free:  # Reuse a free resource if there is one
+                    assignment[event - n] = free.pop()
+                else:
+                    assignment[event - n] = opened  # Otherwise open a new one
+                    opened += 1
+            else:  # End of activity event
+                free.append(assignment[event])  # Its resource is free again
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        self.peak_concurrency = opened  # One resource per concurrently running activity at the peak
+        self.steps.append(("final", self.peak_concurrency))  # Save final state
+        
+        return np.array(assignment, dtype=np.int64)  # Return the resource of each activity
+    
+    def min_resources(self, start_times: Sequence[int], end_times: Sequence[int]) -> int:
+        """
+        Minimum number of resources (the peak concurrency) without building an assignment,
+        fully vectorized: just before the i-th start in sorted order, i activities have
+        started and the number of ends at or before that time have finished
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        starts, ends = self._as_arrays(start_times, end_times)  # Check the input
+        if len(starts) == 0:  # Handle empty input case
+            return 0
+        
+        start_time = time.time()  # Record the start time
+        
+        starts = np.sort(starts)  # Start times in order
+        ends = np.sort(ends)  # End times in order
+        running = np.arange(1, len(starts) + 1) - np.searchsorted(ends, starts, side="right")  # Active after each start
+        self.operations += 2 * len(starts)  # Count every event as an operation
+        self.peak_concurrency = int(running.max())  # The busiest moment
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        return self.peak_concurrency  # Return the number of resources needed
+    
+    def _validate(self, start_times: Sequence[int], end_times: Sequence[int]) -> int:
+        """Check that the lists match and that every activity ends after it starts"""
+        if len(start_times) != len(end_times):  # Verify input lists have same length
+            raise ValueError("Start and end time lists must have the same length")  # Raise error if lengths differ
+        if any(end <= start for start, end in zip(start_times, end_times)):  # Empty activities need no resource
+            raise ValueError("Every activity must end after it starts")  # Raise error for empty activities
+        return len(start_times)  # Number of activities
+    
+    def _as_arrays(self, start_times: Sequence[int], end_times: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert the inputs to NumPy arrays and check them like _validate"""
+        starts = np.asarray(start_times)  # Start times as an array
+        ends = np.asarray(end_times)  # End times as an array
+        if starts.shape != ends.shape or starts.ndim != 1:  # Verify input arrays have same length
+            raise ValueError("Start and end time lists must have the same length")  # Raise error if lengths differ
+        if np.any(ends <= starts):  # Empty activities need no resource
+            raise ValueError("Every activity must end after it starts")  # Raise error for empty activities
+        return starts, ends
\ No newline at end of file
@@ -1,45 +1,125 @@
 import time  # Import the time module to measure execution time
+from array import array  # Import array for compact parent and rank storage
+from io import StringIO  # Import StringIO to bulk-parse edge text like a file
 from typing import List, Tuple, Dict, Set  # Import type hints for better code documentation
 
+import numpy as np  # Import NumPy for columnar edge arrays
+
+EdgeColumns = Tuple[np.ndarray, np.ndarray, np.ndarray]  # Edges as (u, v, weight) column arrays
+
+def as_edge_columns(vertices: int, u, v, w) -> EdgeColumns:
+    """Convert (u, v, weight) columns to arrays and check that they describe edges of the graph"""
+    u, v, w = np.asarray(u), np.asarray(v), np.asarray(w)  # Columns as arrays
+    if not (u.ndim == v.ndim == w.ndim == 1 and len(u) == len(v) == len(w)):  # Verify the columns line up
+        raise ValueError("Edge columns must be one-dimensional and of the same length")  # Raise error if they differ
+    if len(u) and (min(u.min(), v.min()) < 0 or max(u.max(), v.max()) >= vertices):  # Check the endpoints
+        raise ValueError("Edge endpoints must be vertices of the graph")  # Raise error for unknown vertices
+    return u, v, w
+
+def parse_edges(source) -> EdgeColumns:
+    """
+    Bulk-parse 'u,v,weight' lines (one edge per line) into column arrays
+    
+    Args:
+        source: Path of a CSV file, or the text itself as a StringIO
+        
+    Returns:
+        (u, v, weight) arrays; weights are integers when every weight is one
+    """
+    try:
+        table = np.loadtxt(source, delimiter=",", dtype=np.int64, ndmin=2)  # Integer weights, parsed in C
+    except ValueError:
+        if hasattr(source, "seek"):  # Rewind text so it can be parsed again
+            source.seek(0)
+        table = np.loadtxt(source, delimiter=",", dtype=np.float64, ndmin=2)  # Fractional weights
+        if not np.array_equal(table[:, :2], np.floor(table[:, :2])):  # Vertices must still be integers
+            raise ValueError("Edge endpoints must be integers")  # Raise error for fractional vertices
+    if table.size == 0:  # No edges at all
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if table.shape[1] != 3:  # Every line needs exactly three fields
+        raise ValueError("Every edge must be given as 'u,v,weight'")  # Raise error for malformed lines
+    return table[:, 0].astype(np.int64), table[:, 1].astype(np.int64), table[:, 2].copy()
+
+def parse_edges_text(text: str) -> EdgeColumns:
+    """Bulk-parse edges typed as 'u,v,weight' lines (see parse_edges)"""
+    if not text.strip():  # No edges at all
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return parse_edges(StringIO(text))
+
+def load_edges(path: str) -> EdgeColumns:
+    """
+    Load an edge file as column arrays
+    Binary files (.npz, written by save_edges) hold the u, v and weight arrays as they are;
+    any other file is read as 'u,v,weight' CSV lines
+    """
+    if path.endswith(".npz"):  # Binary edge file
+        with np.load(path) as data:  # Archive of the three columns
+            return data["u"], data["v"], data["w"]
+    return parse_edges(path)  # CSV edge file
+
+def save_edges(path: str, u: np.ndarray, v: np.ndarray, w: np.ndarray):
+    """Save column arrays as a binary (.npz) edge file, or as 'u,v,weight' CSV lines otherwise"""
+    if path.endswith(".npz"):  # Binary edge file
+        np.savez(path, u=u, v=v, w=w)  # Store the columns as they are
+    else:
+        fmt = "%d,%d," + ("%d" if np.issubdtype(np.asarray(w).dtype, np.integer) else "%r")  # Keep weights exact
+        np.savetxt(path, np.column_stack((u, v, w)).astype(object), fmt=fmt)  # One edge per line
+
 class DisjointSet:
-    """Disjoint Set (Union-Find) data structure for cycle detection"""
+    """
+    Disjoint Set (Union-Find) data structure for cycle detection
+    Parents and ranks are stored in typed arrays (4 bytes and 1 byte per element instead of a
+    list of int objects), and finds are iterative, so long parent chains cannot hit the
+    recursion limit
+    """
     
     def __init__(self, n: int):
         """Initialize a disjoint set with n elements"""
-        self.parent = list(range(n))  # Initialize parent array: each element is its own parent initially
-        self.rank = [0] * n  # Initialize rank array: all elements have rank 0 initially
+        self.parent = array("i" if n < 2 ** 31 else "q", range(n))  # Initialize parent array: each element is its own parent initially
+        self.rank = array("B", bytes(n))  # Initialize rank array: all elements have rank 0 initially (ranks stay below 64)
     
     def find(self, x: int) -> int:
-        """Find the representative (root) of the set containing x with path compression"""
-        if self.parent[x] != x:  # If x is not its own parent
-            self.parent[x] = self.find(self.parent[x])  # Path compression: update parent to the root
-        return self.parent[x]  # Return the root of the set
+        """Find the representative (root) of the set containing x with path halving"""
+        parent = self.parent  # Local name for the loop
+        while parent[x] != x:  # Until x is the root
+            parent[x] = parent[parent[x]]  # Path halving: point x at its grandparent
+            x = parent[x]  # Continue from there
+        return x  # Return the root of the set
     
     def union(self, x: int, y: int) -> bool:
         """
-        Union the sets containing x and y by rank
+        Union the sets containing x and y by rank, with both finds done in the same call
         Returns True if x and y were in different sets
         """
-        root_x = self.find(x)  # Find the root of x's set
-        root_y = self.find(y)  # Find the root of y's set
+        parent = self.parent  # Local name for the loops
+        while parent[x] != x:  # Find the root of x's set with path halving
+            parent[x] = parent[parent[x]]  # Point x at its grandparent
+            x = parent[x]  # Continue from there
+        while parent[y] != y:  # Find the root of y's set with path halving
+            parent[y] = parent[parent[y]]  # Point y at its grandparent
+            y = parent[y]  # Continue from there
         
-        if root_x == root_y:  # If x and y are already in the same set
+        if x == y:  # If x and y are already in the same set
             return False  # Already in the same set
         
         # Union by rank
-        if self.rank[root_x] < self.rank[root_y]:  # If rank of x's root is less than y's root
-            self.parent[root_x] = root_y  # Make y's root the parent of x's root
-        elif self.rank[root_x] > self.rank[root_y]:  # If rank of x's root is greater than y's root
-            self.parent[root_y] = root_x  # Make x's root the parent of y's root
+        rank = self.rank  # Local name for the rank array
+        if rank[x] < rank[y]:  # If rank of x's root is less than y's root
+            parent[x] = y  # Make y's root the parent of x's root
+        elif rank[x] > rank[y]:  # If rank of x's root is greater than y's root
+            parent[y] = x  # Make x's root the parent of y's root
         else:  # If ranks are equal
-            self.parent[root_y] = root_x  # Make x's root the parent of y's root
-            self.rank[root_x] += 1  # Increment the rank of x's root
-            
+            parent[y] = x  # Make x's root the parent of y's root
+            rank[x] += 1  # Increment the rank of x's root
+        
         return True  # Union successful
 
 class Kruskal:
     """
     Implementation of Kruskal's Minimum Spanning Tree algorithm
+    Every edge considered is logged as one event: its index in the input edge list and
+    whether it was accepted. The log takes 9 bytes per edge, and the MST after any number of
+    events is the accepted edges of that prefix (see mst_at)
     """
     
     def __init__(self):
@@ -50,14 +130,20 @@ class Kruskal:
         self.operations = 0  # Counter for number of operations performed
         self.execution_time = 0  # Tracker for execution time
         self.steps = []  # List to store computation steps for visualization
+        self.edges = []  # Input edges of the last run (the list passed in, not a copy)
+        self.columns = None  # Input (u, v, weight) arrays of the last run, when it was given arrays
+        self.event_edges = array("q")  # Input index of the edge considered at every event
+        self.event_accepted = bytearray()  # 1 if that edge joined the MST, 0 if it was skipped
     
-    def find_mst(self, vertices: int, edges: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    def find_mst(self, vertices: int, edges: List[Tuple[int, int, int]],
+                 record_steps: bool = True) -> List[Tuple[int, int, int]]:
         """
         Find the Minimum Spanning Tree (MST) using Kruskal's algorithm
         
         Args:
             vertices: Number of vertices in the graph
             edges: List of edges as (u, v, weight) tuples
+            record_steps: Whether to log every edge for visualization (turn off for large graphs)
             
         Returns:
             List of edges in the MST
@@ -68,46 +154,152 @@ class Kruskal:
             return []  # Return empty list if no vertices
         
         # Record initial state
-        self.steps.append(("init", edges.copy(), []))  # Save initial state with all edges
+        if record_steps:  # Only log when asked to
+            self.edges = edges  # Events refer to edges by their index in this list
+            self.steps.append(("init", len(edges)))  # Save the number of edges
         
         start_time = time.time()  # Record the start time
         
-        # Sort edges by weight (increasing order)
-        sorted_edges = sorted(edges, key=lambda e: e[2])  # Sort edges by weight (third element of tuple)
-        self.steps.append(("sort", sorted_edges.copy(), []))  # Record sorted edges
+        # Sort edge indices by weight (increasing order); the sort is stable, so equal weights keep input order
+        weights = [edge[2] for edge in edges]  # Weight of every edge
+        order = sorted(range(len(edges)), key=weights.__getitem__)  # Edge indices by weight
+        del weights  # Not needed any more
         
         # Initialize disjoint set for cycle detection
         ds = DisjointSet(vertices)  # Create a disjoint set with 'vertices' number of elements
+        union = ds.union  # Bound method, looked up once
         
         # Result will store the edges of the MST
         mst = []  # Initialize empty list for MST edges
+        needed = vertices - 1  # Edges of a spanning tree
+        accepted = self.event_accepted  # Local name for the log
         
         # Process each edge in order of increasing weight
-        for edge in sorted_edges:  # Iterate through sorted edges
+        for index in order:  # Iterate through edge indices by weight
             self.operations += 1  # Count each edge consideration as an operation
-            u, v, weight = edge  # Unpack the edge: source vertex, destination vertex, and weight
+            edge = edges[index]  # The edge itself
             
-            # Check if adding the edge would create a cycle
-            if ds.find(u) != ds.find(v):  # If u and v are in different sets (no cycle would be created)
-                # Include this edge in the MST
+            # A single find-and-union call tells whether the edge would create a cycle
+            if union(edge[0], edge[1]):  # If u and v were in different sets (no cycle is created)
                 mst.append(edge)  # Add edge to MST
-                ds.union(u, v)  # Union the sets containing u and v
-                self.steps.append(("add", edge, mst.copy()))  # Record adding edge to MST
-            else:
-                # Skip this edge (would create a cycle)
-                self.steps.append(("skip", edge, mst.copy()))  # Record skipping edge
+                if record_steps:  # Only log when asked to
+                    accepted.append(1)  # Record adding edge to MST
+            elif record_steps:  # Skip this edge (would create a cycle)
+                accepted.append(0)  # Record skipping edge
             
             # Check if MST is complete (has v-1 edges)
-            if len(mst) == vertices - 1:  # If we have v-1 edges, MST is complete
+            if len(mst) == needed:  # If we have v-1 edges, MST is complete
                 break  # Exit the loop early
         
         self.execution_time = time.time() - start_time  # Calculate total execution time
         
         # Record final MST
-        self.steps.append(("final", None, mst.copy()))  # Save final MST
+        if record_steps:  # Only log when asked to
+            self.event_edges = array("q", order[:len(accepted)])  # Edges considered, in order
+            self.steps.append(("final", len(mst)))  # Save the size of the final MST
         
         return mst  # Return the MST as a list of edges
     
+    def find_mst_arrays(self, vertices: int, u, v, w, record_steps: bool = True,
+                        chunk_size: int = 1 << 16) -> List[Tuple[int, int, int]]:
+        """
+        Find the MST of a graph given as (u, v, weight) column arrays.
+        The edge order comes from one stable np.argsort of the weights, and edges are
+        streamed through the union-find a chunk at a time in that order, so no per-edge
+        tuples are built and edges after the MST is complete are never touched.
+        
+        Args:
+            vertices: Number of vertices in the graph
+            u, v: Endpoints of every edge
+            w: Weight of every edge
+            record_steps: Whether to log every edge for visualization
+            chunk_size: Edges converted to Python integers at a time
+            
+        Returns:
+            List of edges in the MST, as (u, v, weight) tuples like find_mst
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        u, v, w = as_edge_columns(vertices, u, v, w)  # Check the input
+        
+        if vertices <= 0:  # Check for invalid input
+            return []  # Return empty list if no vertices
+        
+        # Record initial state
+        if record_steps:  # Only log when asked to
+            self.columns = (u, v, w)  # Events refer to edges by their index in these arrays
+            self.steps.append(("init", len(w)))  # Save the number of edges
+        
+        start_time = time.time()  # Record the start time
+        
+        order = np.argsort(w, kind="stable")  # Edge indices by weight, equal weights in input order
+        
+        # Initialize disjoint set for cycle detection
+        ds = DisjointSet(vertices)  # Create a disjoint set with 'vertices' number of elements
+        union = ds.union  # Bound method, looked up once
+        
+        chosen = []  # Positions in the sorted order of the MST edges
+        needed = vertices - 1  # Edges of a spanning tree
+        accepted = self.event_accepted  # Local name for the log
+        considered = 0  # Edges looked at so far
+        
+        # Process the edges in order of increasing weight, one chunk at a time
+        for low in range(0, len(order), chunk_size):  # For each chunk of the sorted order
+            chunk = order[low:low + chunk_size]  # Edge indices of this chunk
+            for position, (x, y) in enumerate(zip(u[chunk].tolist(), v[chunk].tolist()), low):
+                considered = position + 1  # Count this edge
+                
+                # A single find-and-union call tells whether the edge would create a cycle
+                if union(x, y):  # If x and y were in different sets (no cycle is created)
+                    chosen.append(position)  # Add edge to MST
+                    if record_steps:  # Only log when asked to
+                        accepted.append(1)  # Record adding edge to MST
+                elif record_steps:  # Skip this edge (would create a cycle)
+                    accepted.append(0)  # Record skipping edge
+                
+                # Check if MST is complete (has v-1 edges)
+                if len(chosen) == needed:  # If we have v-1 edges, MST is complete
+                    break  # Exit the chunk early
+            else:
+                continue  # The chunk is used up, go on with the next one
+            break  # The MST is complete, skip the remaining chunks
+        
+        self.operations += considered  # Count each edge consideration as an operation
+        picked = order[chosen]  # Input indices of the MST edges
+        mst = list(zip(u[picked].tolist(), v[picked].tolist(), w[picked].tolist()))  # MST edges as tuples
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record final MST
+        if record_steps:  # Only log when asked to
+            self.event_edges.frombytes(order[:considered].astype(np.int64).tobytes())  # Edges considered, in order
+            self.steps.append(("final", len(mst)))  # Save the size of the final MST
+        
+        return mst  # Return the MST as a list of edges
+    
+    def event(self, step: int) -> Tuple[Tuple[int, int, int], bool]:
+        """Return (edge, accepted) for one event of the last run's log"""
+        return self._edge(self.event_edges[step]), bool(self.event_accepted[step])
+    
+    def mst_at(self, step: int) -> List[Tuple[int, int, int]]:
+        """
+        Rebuild the MST so far from the log
+        
+        Args:
+            step: Number of events to replay (0 gives an empty tree)
+            
+        Returns:
+            Edges accepted among the first step events, in the order they were added
+        """
+        picked = [index for index, flag in zip(self.event_edges[:step], self.event_accepted[:step]) if flag]
+        return [self._edge(index) for index in picked]  # Accepted edges of the prefix
+    
+    def _edge(self, index: int) -> Tuple[int, int, int]:
+        """Input edge number index of the last run, as a (u, v, weight) tuple"""
+        if self.columns is None:  # The last run was given a list of tuples
+            return self.edges[index]
+        u, v, w = self.columns  # The last run was given column arrays
+        return int(u[index]), int(v[index]), w[index].item()
+    
     def calculate_mst_weight(self, mst: List[Tuple[int, int, int]]) -> int:
         """Calculate the total weight of the MST"""
         return sum(weight for _, _, weight in mst)  # Sum the weights of all edges in the MST
@@ -123,17 +315,16 @@ class Kruskal:
             adj_list[u].append(v)  # Add v to u's adjacency list
             adj_list[v].append(u)  # Add u to v's adjacency list (for undirected graph)
         
-        # DFS to check connectivity
+        # DFS to check connectivity, with an explicit stack so large graphs cannot hit the recursion limit
         visited = [False] * vertices  # Initialize visited array to track visited vertices
-        
-        def dfs(node):  # Define DFS function to traverse the graph
-            visited[node] = True  # Mark current node as visited
+        visited[0] = True  # Start DFS from vertex 0
+        stack = [0]  # Vertices whose neighbors are still to be visited
+        while stack:  # Until every reachable vertex has been visited
+            node = stack.pop()  # Current node
             for neighbor in adj_list[node]:  # For each neighbor of current node
                 if not visited[neighbor]:  # If neighbor hasn't been visited
-                    dfs(neighbor)  # Recursively visit the neighbor
-        
-        # Start DFS from first vertex
-        dfs(0)  # Start DFS from vertex 0
+                    visited[neighbor] = True  # Mark it as visited
+                    stack.append(neighbor)  # Visit its neighbors later
         
         # Check if all vertices are visited
         return all(visited)  # Return True if all vertices were visited, False otherwise
\ No newline at end of file
@@ -0,0 +1,85 @@
+import time  # Import the time module to measure execution time
+from typing import List, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the edge columns
+
+from algorithms.greedy.boruvka import Boruvka  # Import the vectorized Borůvka engine
+from algorithms.greedy.filter_kruskal import FilterKruskal  # Import the Filter-Kruskal engine
+from algorithms.greedy.kruskal import Kruskal  # Import the classic Kruskal engine
+from algorithms.greedy.prim import Prim  # Import the O(V^2) adjacency-matrix Prim engine
+
+# Engine name -> engine class; every engine has find_mst_arrays(vertices, u, v, w) and returns Kruskal's tuples
+ENGINES = {
+    "kruskal": Kruskal,
+    "filter_kruskal": FilterKruskal,
+    "boruvka": Boruvka,
+    "prim": Prim  # Builds a V x V matrix, so only for graphs with a few thousand vertices
+}
+
+class MinimumSpanningTree:
+    """
+    Minimum Spanning Tree front end that picks an engine by edge density
+    Sparse graphs go to Borůvka, whose vectorized rounds touch every edge about log V times
+    but never sort. Denser graphs go to Filter-Kruskal, which discards most heavy edges in
+    bulk once the light ones have connected the graph. Prim is never picked: from edge
+    columns, building its adjacency matrix costs about as much as Filter-Kruskal's whole run;
+    call Prim.find_mst_matrix directly when the graph already is a matrix.
+    """
+    
+    SPARSE_DEGREE = 32  # Largest average degree (2E / V) still handed to Borůvka
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+        self.engine = None  # Name of the engine used by the last run
+    
+    def select_engine(self, vertices: int, edge_count: int) -> str:
+        """Name of the engine expected to be fastest for a graph of this size"""
+        if 2 * edge_count <= self.SPARSE_DEGREE * vertices:  # Few edges per vertex
+            return "boruvka"
+        return "filter_kruskal"  # Many edges per vertex
+    
+    def find_mst_arrays(self, vertices: int, u, v, w, engine: str = "auto") -> List[Tuple[int, int, int]]:
+        """
+        Find the MST of a graph given as (u, v, weight) column arrays
+        
+        Args:
+            vertices: Number of vertices in the graph
+            u, v: Endpoints of every edge
+            w: Weight of every edge
+            engine: Name of an engine in ENGINES, or "auto" to pick one by edge density
+            
+        Returns:
+            List of edges in the MST, as (u, v, weight) tuples in the order Kruskal adds them
+            (Prim: in the order the tree grows)
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        if engine == "auto":  # Pick by density
+            engine = self.select_engine(vertices, len(np.asarray(w)))
+        if engine not in ENGINES:  # Check for unknown engines
+            raise ValueError(f"Unknown MST engine: {engine}")  # Raise error for bad names
+        
+        start_time = time.time()  # Record the start time
+        
+        solver = ENGINES[engine]()  # Fresh engine instance
+        if engine == "kruskal":
+            mst = solver.find_mst_arrays(vertices, u, v, w, record_steps=False)  # No per-edge log needed here
+        else:
+            mst = solver.find_mst_arrays(vertices, u, v, w)
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        self.engine = engine  # Remember which engine ran
+        self.operations = solver.operations  # Operations reported by the engine
+        self.steps = [("engine", engine)] + solver.steps  # Record the choice, then the engine's own steps
+        
+        return mst  # Return the MST as a list of edges
+    
+    def calculate_mst_weight(self, mst: List[Tuple[int, int, int]]) -> int:
+        """Calculate the total weight of the MST"""
+        return sum(weight for _, _, weight in mst)  # Sum the weights of all edges in the MST
\ No newline at end of file
@@ -0,0 +1,252 @@
+import time  # Import the time module to measure execution time
+from array import array  # Import array for the heap's position index
+from typing import List, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the adjacency-matrix variant
+
+from algorithms.greedy.kruskal import as_edge_columns  # Import the shared input checks
+
+class IndexedMinHeap:
+    """
+    Binary min-heap of items 0..n-1 keyed by a number, with decrease-key
+    position[item] is the item's slot in the heap (-1 when absent), so an item's key can be
+    lowered in place instead of pushing a duplicate entry
+    """
+    
+    def __init__(self, n: int):
+        """Initialize an empty heap for items 0..n-1"""
+        self.heap = []  # Items in heap order
+        self.keys = [0] * n  # Current key of every item
+        self.position = array("q", [-1]) * n  # Slot of every item in the heap, -1 when absent
+    
+    def __len__(self) -> int:
+        return len(self.heap)  # Number of items in the heap
+    
+    def __contains__(self, item: int) -> bool:
+        return self.position[item] >= 0  # Whether the item is in the heap
+    
+    def push(self, item: int, key):
+        """Insert an item that is not in the heap"""
+        self.keys[item] = key  # Remember its key
+        self.heap.append(item)  # Put it in the last slot
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)  # Move it up to its place
+    
+    def decrease_key(self, item: int, key):
+        """Lower the key of an item already in the heap"""
+        self.keys[item] = key  # New, smaller key
+        self._sift_up(self.position[item])  # Move it up to its place
+    
+    def pop(self) -> int:
+        """Remove and return the item with the smallest key"""
+        heap, position = self.heap, self.position  # Local names
+        top = heap[0]  # Item with the smallest key
+        last = heap.pop()  # Take the last item out
+        position[top] = -1  # The top item leaves the heap
+        if heap:  # Move the last item to the root and sift it down
+            heap[0] = last
+            position[last] = 0
+            self._sift_down(0)
+        return top
+    
+    def _sift_up(self, slot: int):
+        """Move the item in slot up while its parent has a larger key"""
+        heap, keys, position = self.heap, self.keys, self.position  # Local names for the loop
+        item = heap[slot]  # Item being moved
+        key = keys[item]  # Its key
+        while slot > 0:  # Until the root
+            parent = (slot - 1) >> 1  # Parent slot
+            if keys[heap[parent]] <= key:  # The parent is not larger, stop here
+                break
+            heap[slot] = heap[parent]  # Move the parent down
+            position[heap[slot]] = slot
+            slot = parent
+        heap[slot] = item  # Place the item
+        position[item] = slot
+    
+    def _sift_down(self, slot: int):
+        """Move the item in slot down while a child has a smaller key"""
+        heap, keys, position = self.heap, self.keys, self.position  # Local names for the loop
+        size = len(heap)  # Number of items
+        item = heap[slot]  # Item being moved
+        key = keys[item]  # Its key
+        while True:
+            child = 2 * slot + 1  # Left child slot
+            if child >= size:  # No children, stop here
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:  # The right child is smaller
+                child += 1
+            if keys[heap[child]] >= key:  # No child is smaller, stop here
+                break
+            heap[slot] = heap[child]  # Move the child up
+            position[heap[slot]] = slot
+            slot = child
+        heap[slot] = item  # Place the item
+        position[item] = slot
+
+class Prim:
+    """
+    Implementation of Prim's Minimum Spanning Tree algorithm
+    find_mst grows the tree from a vertex with an indexed heap that lowers a vertex's key in
+    place (decrease-key), so the heap never holds more than V entries: O(E log V).
+    find_mst_matrix works on an adjacency matrix with plain arrays: O(V^2), which beats
+    sorting the edges once a good fraction of all vertex pairs are connected.
+    Both return the same (u, v, weight) tuples as Kruskal, and a spanning forest when the
+    graph is not connected.
+    """
+    
+    def __init__(self):
+        self.reset()  # Initialize the object by calling the reset method
+    
+    def reset(self):
+        """Reset all metrics and states"""
+        self.operations = 0  # Counter for number of operations performed
+        self.execution_time = 0  # Tracker for execution time
+        self.steps = []  # List to store computation steps for visualization
+    
+    def find_mst(self, vertices: int, edges: List[Tuple[int, int, int]],
+                 record_steps: bool = True) -> List[Tuple[int, int, int]]:
+        """
+        Find the Minimum Spanning Tree (MST) using Prim's algorithm with a decrease-key heap
+        
+        Args:
+            vertices: Number of vertices in the graph
+            edges: List of edges as (u, v, weight) tuples
+            record_steps: Whether to log every edge added for visualization
+            
+        Returns:
+            List of edges in the MST (the input tuples), in the order they are added
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        
+        if vertices <= 0:  # Check for invalid input
+            return []  # Return empty list if no vertices
+        
+        if record_steps:  # Only log when asked to
+            self.steps.append(("init", len(edges)))  # Save the number of edges
+        
+        start_time = time.time()  # Record the start time
+        
+        # Build adjacency lists of edge indices
+        adjacency = [[] for _ in range(vertices)]  # Edges at every vertex
+        for index, (u, v, _) in enumerate(edges):  # For each edge in the graph
+            adjacency[u].append(index)  # The edge leaves u
+            adjacency[v].append(index)  # and v (undirected graph)
+        
+        heap = IndexedMinHeap(vertices)  # Vertices next to the tree, keyed by their lightest edge to it
+        best_edge = [-1] * vertices  # Index of that lightest edge
+        in_tree = bytearray(vertices)  # 1 once a vertex is in the tree
+        mst = []  # Initialize empty list for MST edges
+        
+        for root in range(vertices):  # Start a new tree from every vertex not reached yet
+            if in_tree[root]:
+                continue
+            in_tree[root] = 1  # The root joins without an edge
+            vertex = root  # Vertex whose edges are scanned next
+            while True:
+                # Offer the new tree vertex's edges to its neighbors
+                for index in adjacency[vertex]:  # For each edge at the vertex
+                    self.operations += 1  # Count each edge relaxation as an operation
+                    u, v, weight = edges[index]  # The edge
+                    other = v if u == vertex else u  # The vertex across it
+                    if in_tree[other]:  # Already in the tree (or a self-loop)
+                        continue
+                    if other not in heap:  # First edge seen to this vertex
+                        heap.push(other, weight)
+                        best_edge[other] = index
+                    elif weight < heap.keys[other]:  # Lighter than its best edge so far
+                        heap.decrease_key(other, weight)
+                        best_edge[other] = index
+                
+                if not heap:  # Nothing else is reachable from this root
+                    break
+                vertex = heap.pop()  # Closest vertex to the tree
+                in_tree[vertex] = 1  # It joins the tree
+                edge = edges[best_edge[vertex]]  # Through its lightest edge
+                mst.append(edge)  # Add edge to MST
+                if record_steps:  # Only log when asked to
+                    self.steps.append(("add", edge))  # Record adding edge to MST
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record final MST
+        if record_steps:  # Only log when asked to
+            self.steps.append(("final", len(mst)))  # Save the size of the final MST
+        
+        return mst  # Return the MST as a list of edges
+    
+    def find_mst_matrix(self, matrix, no_edge=np.inf) -> List[Tuple[int, int, int]]:
+        """
+        Find the MST of a graph given as a symmetric V x V matrix of edge weights, in O(V^2)
+        Each step picks the closest vertex with one argmin over the distance array and lowers
+        the distances of the others with one np.minimum against the new vertex's row.
+        
+        Args:
+            matrix: Weight of the edge between every pair of vertices
+            no_edge: Entry marking pairs without an edge (the diagonal is ignored)
+            
+        Returns:
+            List of edges in the MST as (u, v, weight) tuples, in the order they are added
+        """
+        self.reset()  # Reset all metrics before starting the algorithm
+        matrix = np.asarray(matrix)  # Weights as an array
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:  # Check the shape
+            raise ValueError("Adjacency matrix must be square")  # Raise error for bad shapes
+        vertices = len(matrix)  # Number of vertices
+        
+        self.steps.append(("init", vertices))  # Save the number of vertices
+        
+        start_time = time.time()  # Record the start time
+        
+        weights = matrix.astype(np.float64)  # Distances need infinity for missing edges
+        weights[matrix == no_edge] = np.inf  # Pairs without an edge
+        np.fill_diagonal(weights, np.inf)  # Self-loops never join the tree
+        
+        distance = np.full(vertices, np.inf)  # Lightest edge from every vertex to the tree
+        parent = np.full(vertices, -1)  # Tree end of that edge
+        outside = np.ones(vertices, dtype=bool)  # Vertices not in the tree yet
+        mst = []  # Initialize empty list for MST edges
+        
+        for _ in range(vertices):  # One vertex joins the tree per step
+            candidates = np.where(outside, distance, np.inf)  # Only vertices outside the tree
+            vertex = int(np.argmin(candidates))  # Closest one
+            if candidates[vertex] == np.inf:  # Nothing outside is reachable: start a new tree
+                vertex = int(np.argmax(outside))  # First vertex outside the tree
+            elif parent[vertex] >= 0:  # Reached through an edge
+                tree_end = int(parent[vertex])  # Tree end of the edge
+                mst.append((tree_end, vertex, matrix[tree_end, vertex].item()))  # Add edge to MST
+            outside[vertex] = False  # It joins the tree
+            
+            closer = outside & (weights[vertex] < distance)  # Vertices now closer through this vertex
+            distance[closer] = weights[vertex][closer]  # Lower their distances
+            parent[closer] = vertex  # through this vertex
+            self.operations += vertices  # Count each distance comparison as an operation
+        
+        self.execution_time = time.time() - start_time  # Calculate total execution time
+        
+        # Record final MST
+        self.steps.append(("final", len(mst)))  # Save the size of the final MST
+        
+        return mst  # Return the MST as a list of edges
+    
+    def find_mst_arrays(self, vertices: int, u, v, w) -> List[Tuple[int, int, int]]:
+        """
+        Find the MST of a graph given as (u, v, weight) column arrays by building its
+        adjacency matrix (lightest edge of every pair) and running find_mst_matrix
+        """
+        u, v, w = as_edge_columns(vertices, u, v, w)  # Check the input
+        mst = self.find_mst_matrix(self.adjacency_matrix(vertices, u, v, w))  # Weights come back as floats
+        return [(x, y, w.dtype.type(weight).item()) for x, y, weight in mst]  # Restore the weight type
+    
+    def adjacency_matrix(self, vertices: int, u, v, w) -> np.ndarray:
+        """V x V matrix of the lightest edge between every pair of vertices, np.inf where there is none"""
+        matrix = np.full((vertices, vertices), np.inf)  # No edges yet
+        cells = matrix.reshape(-1)  # Flat view: pair (x, y) is cell x * V + y
+        w = np.asarray(w, dtype=np.float64)  # Same type as the matrix, or np.minimum.at takes a slow path
+        np.minimum.at(cells, u * vertices + v, w)  # Lightest edge from u to v
+        np.minimum.at(cells, v * vertices + u, w)  # The graph is undirected
+        return matrix
+    
+    def calculate_mst_weight(self, mst: List[Tuple[int, int, int]]) -> int:
+        """Calculate the total weight of the MST"""
+        return sum(weight for _, _, weight in mst)  # Sum the weights of all edges in the MST
\ No newline at end of file
@@ -0,0 +1,73 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import time  # Import the time module to measure execution time
+from typing import Dict, List, Optional  # Import type hints for better code documentation
+
+from algorithms.greedy.adaptive_huffman import AdaptiveHuffmanCoding  # Import the one-pass coder
+from algorithms.greedy.huffman_coding import HuffmanCoding  # Import the static two-pass coder
+from benchmarks.huffman_benchmark import make_text  # Reuse the English-like sample text
+
+# Engine name -> (encoder, decoder, largest input size it can handle here)
+ENGINES = {
+    "adaptive": (lambda data, chunk: AdaptiveHuffmanCoding().encode(data, chunk),
+                 lambda blob, chunk: AdaptiveHuffmanCoding().decode(blob, chunk), 10 ** 6),  # Pure Python per symbol
+    "static": (lambda data, chunk: HuffmanCoding().compress(data.decode("latin-1")),  # Frequency pass plus packing
+               lambda blob, chunk: HuffmanCoding().decompress(blob).encode("latin-1"), 10 ** 8)
+}
+
+DEFAULT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]  # Input sizes in bytes benchmarked by default
+
+def benchmark_engine(engine: str, data: bytes, chunk: int, repeat: int = 1) -> Optional[Dict]:
+    """
+    Time one engine encoding and decoding one input
+    Returns None when the input is beyond what the engine can handle
+    """
+    encode, decode, max_size = ENGINES[engine]  # Look up the engine
+    if len(data) > max_size:  # Skip sizes the engine cannot reach
+        return None
+    
+    encode_time = decode_time = float("inf")  # Best times so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        blob = encode(data, chunk)  # Run the encoder
+        encode_time = min(encode_time, time.perf_counter() - start)  # Keep the best run
+        start = time.perf_counter()  # Start the clock
+        decoded = decode(blob, chunk)  # Run the decoder
+        decode_time = min(decode_time, time.perf_counter() - start)  # Keep the best run
+    if decoded != data:  # A fast but wrong coder is no use
+        raise ValueError(f"The {engine} engine did not round-trip the data")
+    
+    return {
+        "engine": engine,
+        "size": len(data),
+        "compressed": len(blob),  # Everything the decoder needs, headers included
+        "encode_mb_per_s": len(data) / encode_time / 1e6,
+        "decode_mb_per_s": len(data) / decode_time / 1e6
+    }
+
+def run_benchmark(sizes: List[int], engines: Optional[List[str]] = None, chunk: int = 1 << 16,
+                  repeat: int = 1) -> List[Dict]:
+    """Benchmark every engine on every size and return one row per run"""
+    rows = []  # Benchmark results
+    for size in sizes:  # For each size
+        data = make_text(size).encode("ascii")  # Sample input of this size
+        for engine in engines or ENGINES:  # For each engine
+            row = benchmark_engine(engine, data, chunk, repeat)  # Time the engine
+            if row is not None:  # Skip engines that cannot reach this size
+                rows.append(row)
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark adaptive against static Huffman coding")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="input sizes in bytes")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines to benchmark (default: all)")
+    parser.add_argument("--chunk", type=int, default=1 << 16, help="bytes per feed call of the adaptive coder")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'engine':<10}{'size':>12}{'compressed':>12}{'ratio':>8}{'enc MB/s':>10}{'dec MB/s':>10}")  # Table header
+    for row in run_benchmark(args.sizes, args.engines, args.chunk, args.repeat):  # For each measurement
+        print(f"{row['engine']:<10}{row['size']:>12}{row['compressed']:>12}{row['size'] / row['compressed']:>8.3f}"
+              f"{row['encode_mb_per_s']:>10.2f}{row['decode_mb_per_s']:>10.2f}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
@@ -0,0 +1,87 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import time  # Import the time module to measure execution time
+from typing import Dict, List, Optional  # Import type hints for better code documentation
+
+from algorithms.greedy.coin_change import CoinChange  # Import the coin change engines
+
+DEFAULT_COINS = [1, 5, 10, 25, 50]  # US coin denominations
+DEFAULT_SIZES = [10 ** 6, 10 ** 7, 10 ** 8]  # Amounts benchmarked by default
+DEFAULT_MODULUS = 10 ** 9 + 7  # Modulus for the uint64 engine
+LARGEST_MODULUS = CoinChange.MAX_MODULUS - 1  # Largest modulus count_ways_mod accepts (its shortest reduction blocks)
+
+def loop_count_ways(coins: List[int], amount: int) -> int:
+    """Plain Python ways[a] += ways[a - c] loop, the baseline the engines are compared with"""
+    ways = [1] + [0] * amount  # One way to make 0
+    for coin in set(coins):  # One pass per coin
+        for a in range(coin, amount + 1):  # Every amount the coin fits into
+            ways[a] += ways[a - coin]  # Add the ways that end with this coin
+    return ways[amount]
+
+# Engine name -> (runner, largest amount it can handle here, modulus override or None)
+# Larger amounts are reported as skipped: the loop is too slow past 10^6, and the exact
+# engine keeps one Python int object per amount, several GB of memory at 10^8
+ENGINES = {
+    "loop": (lambda cc, coins, amount, modulus: loop_count_ways(coins, amount) % modulus, 10 ** 6, None),
+    "exact": (lambda cc, coins, amount, modulus: cc.count_ways(coins, amount) % modulus, 10 ** 7, None),  # Big ints, one object per amount
+    "modular": (lambda cc, coins, amount, modulus: cc.count_ways_mod(coins, amount, modulus), 10 ** 8, None),  # 8 bytes per amount
+    "modular_max": (lambda cc, coins, amount, modulus: cc.count_ways_mod(coins, amount, modulus), 10 ** 8,
+                    LARGEST_MODULUS)  # Same engine at the upper bound of its modulus
+}
+
+def benchmark_engine(cc: CoinChange, engine: str, coins: List[int], amount: int,
+                     modulus: int, repeat: int = 1) -> Optional[Dict]:
+    """
+    Time one engine for one amount
+    Returns a row marked skipped when the amount is beyond what the engine can handle
+    """
+    runner, max_amount, fixed_modulus = ENGINES[engine]  # Look up the engine
+    modulus = fixed_modulus or modulus  # Some engines always run with their own modulus
+    if amount > max_amount:  # Skip amounts the engine cannot reach, but say so
+        return {"engine": engine, "amount": amount, "modulus": modulus, "skipped": max_amount}
+    
+    best = float("inf")  # Best total time so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        result = runner(cc, coins, amount, modulus)  # Run the engine
+        best = min(best, time.perf_counter() - start)  # Keep the best run
+    
+    return {
+        "engine": engine,
+        "amount": amount,
+        "skipped": None,  # Largest amount the engine handles, when this one was skipped
+        "coins": len(set(coins)),
+        "modulus": modulus,
+        "ways_mod": result,  # Reduced by the modulus so that engines sharing it can be cross-checked
+        "time": best,
+        "cells_per_second": amount * len(set(coins)) / best if best > 0 else float("inf")
+    }
+
+def run_benchmark(sizes: List[int], coins: List[int], modulus: int,
+                  engines: Optional[List[str]] = None, repeat: int = 1) -> List[Dict]:
+    """Benchmark every engine on every amount and return one row per run"""
+    cc = CoinChange()  # Shared engine instance
+    rows = []  # Benchmark results
+    for amount in sizes:  # For each amount
+        for engine in engines or ENGINES:  # For each engine
+            rows.append(benchmark_engine(cc, engine, coins, amount, modulus, repeat))  # Time the engine
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the coin change ways-counting engines")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="amounts to benchmark")
+    parser.add_argument("--coins", type=int, nargs="+", default=DEFAULT_COINS, help="coin denominations")
+    parser.add_argument("--modulus", type=int, default=DEFAULT_MODULUS, help="modulus for the uint64 engine")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'engine':<12}{'amount':>12}{'modulus':>20}{'ways mod m':>20}{'time s':>12}{'cells/s':>14}")  # Table header
+    for row in run_benchmark(args.sizes, args.coins, args.modulus, args.engines, args.repeat):  # For each measurement
+        if row["skipped"]:  # Beyond the engine's cap
+            print(f"{row['engine']:<12}{row['amount']:>12}{row['modulus']:>20}  skipped (capped at {row['skipped']})")
+            continue
+        print(f"{row['engine']:<12}{row['amount']:>12}{row['modulus']:>20}{row['ways_mod']:>20}{row['time']:>12.4f}"
+              f"{row['cells_per_second']:>14.3g}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
@@ -0,0 +1,94 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import operator  # Import operator for the plain multiplication hook
+import time  # Import the time module to measure execution time
+from typing import Dict, List, Optional  # Import type hints for better code documentation
+
+from algorithms.dynamic_programming.fibonacci import Fibonacci  # Import the Fibonacci engines
+
+# Engine name -> (Fibonacci method, largest n the engine can handle here)
+ENGINES = {
+    "memoization": ("fibonacci_memo_iterative", 10 ** 5),  # Bounded by the memo holding every F(k)
+    "tabulation": ("fibonacci_tabulation", 10 ** 5),  # Bounded by the table holding every F(k)
+    "fast_doubling": ("fibonacci_fast_doubling", 10 ** 6),
+    "matrix": ("fibonacci_matrix", 10 ** 6)
+}
+
+DEFAULT_SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]  # Values of n benchmarked by default
+
+class MultiplicationTimer:
+    """Multiplication hook that accumulates the time spent inside big-int multiplications"""
+    
+    def __init__(self):
+        self.elapsed = 0.0  # Total time spent multiplying
+        self.count = 0  # Number of multiplications timed
+    
+    def __call__(self, a: int, b: int) -> int:
+        start = time.perf_counter()  # Time only the multiplication itself
+        product = a * b  # The big-int multiplication being measured
+        self.elapsed += time.perf_counter() - start  # Accumulate the multiplication time
+        self.count += 1  # Count the multiplication
+        return product
+
+def benchmark_engine(fib: Fibonacci, engine: str, n: int, repeat: int = 3) -> Optional[Dict]:
+    """
+    Time one engine for one n
+    Returns None when n is beyond what the engine can handle
+    """
+    method_name, max_n = ENGINES[engine]  # Look up the engine
+    if n > max_n:  # Skip sizes the engine cannot reach
+        return None
+    method = getattr(fib, method_name)  # Bound engine method
+    
+    # Best-of-repeat total time with the plain multiplication
+    fib.multiply = operator.mul  # Make sure no profiling hook is installed
+    total_time = float("inf")  # Best total time so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        result = method(n)  # Run the engine
+        total_time = min(total_time, time.perf_counter() - start)  # Keep the best run
+    operations = fib.operations  # Operations reported by the engine
+    
+    # One extra run with the timing hook to split out the multiplication cost
+    timer = MultiplicationTimer()  # Fresh multiplication timer
+    fib.multiply = timer  # Install the timing hook
+    try:
+        method(n)  # Run the engine once more
+    finally:
+        fib.multiply = operator.mul  # Always restore the plain multiplication
+    
+    return {
+        "engine": engine,
+        "n": n,
+        "bits": result.bit_length(),
+        "operations": operations,
+        "multiplications": timer.count,
+        "total_time": total_time,
+        "multiplication_time": timer.elapsed,
+        "loop_overhead": max(total_time - timer.elapsed, 0.0)  # Everything that is not a multiplication
+    }
+
+def run_benchmark(sizes: List[int], engines: Optional[List[str]] = None, repeat: int = 3) -> List[Dict]:
+    """Benchmark every engine on every size and return one row per run"""
+    fib = Fibonacci()  # Shared engine instance
+    rows = []  # Benchmark results
+    for n in sizes:  # For each size
+        for engine in engines or ENGINES:  # For each engine
+            row = benchmark_engine(fib, engine, n, repeat)  # Time the engine
+            if row is not None:  # Skip engines that cannot reach this size
+                rows.append(row)
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Fibonacci engines")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="values of n to benchmark")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'engine':<14}{'n':>10}{'bits':>10}{'mults':>8}{'total s':>12}{'mult s':>12}{'loop s':>12}")  # Table header
+    for row in run_benchmark(args.sizes, args.engines, args.repeat):  # For each measurement
+        print(f"{row['engine']:<14}{row['n']:>10}{row['bits']:>10}{row['multiplications']:>8}"
+              f"{row['total_time']:>12.6f}{row['multiplication_time']:>12.6f}{row['loop_overhead']:>12.6f}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
@@ -0,0 +1,97 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import random  # Import random to generate reproducible sample text
+import time  # Import the time module to measure execution time
+from typing import Callable, Dict, List, Optional, Tuple  # Import type hints for better code documentation
+
+from algorithms.greedy.huffman_coding import HuffmanCoding  # Import the Huffman engines
+
+# Engine name -> (encode method, decode method, largest text length the engine can handle here)
+ENGINES = {
+    "string": ("encode", "decode", 10 ** 6),  # Bounded by building a '0'/'1' string of every bit
+    "packed": ("encode_packed", "decode_packed", 10 ** 8)
+}
+
+DEFAULT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]  # Text lengths benchmarked by default
+
+WORDS = ("the of and to in is that for it as was with be by on not he this are or his from at which but "
+         "have an they you were her she there been one all we their has would when if so no will more "
+         "algorithm greedy huffman tree code frequency node encode decode bit byte").split()  # Sample vocabulary
+
+def make_text(size: int, seed: int = 0) -> str:
+    """Generate size characters of English-like text with Zipf-like word frequencies"""
+    rng = random.Random(seed)  # Reproducible generator
+    weights = [1 / rank for rank in range(1, len(WORDS) + 1)]  # Frequent words first
+    words = rng.choices(WORDS, weights, k=size // 2 + 1)  # Every word plus its space is at least 2 characters
+    return " ".join(words)[:size]  # Trim to the requested length
+
+def best_time(huffman: HuffmanCoding, run: Callable, repeat: int) -> Tuple[float, object]:
+    """Run a callable repeat times and return (best time, last result)"""
+    best = float("inf")  # Best time so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        result = run()  # Run the engine
+        best = min(best, time.perf_counter() - start)  # Keep the best run
+        huffman.steps.clear()  # Don't let recorded steps pile up between runs
+    return best, result
+
+def benchmark_engine(huffman: HuffmanCoding, engine: str, text: str, repeat: int = 3) -> Optional[Dict]:
+    """
+    Time one encoder and its decoder on one text (the tree is built beforehand and not timed)
+    Returns None when the text is beyond what the engine can handle
+    """
+    encode_name, decode_name, max_size = ENGINES[engine]  # Look up the engine
+    if len(text) > max_size:  # Skip sizes the engine cannot reach
+        return None
+    encode = getattr(huffman, encode_name)  # Bound encoder method
+    decode = getattr(huffman, decode_name)  # Bound decoder method
+    
+    encode_time, encoded = best_time(huffman, lambda: encode(text), repeat)  # Time the encoder
+    if engine == "packed":
+        bits = encoded[1]  # Size of the encoding in bits
+        decode_time, decoded = best_time(huffman, lambda: decode(*encoded), repeat)  # Time the decoder
+    else:
+        bits = len(encoded[0])  # One character per bit
+        decode_time, decoded = best_time(  # Time the tree walk without per-bit steps
+            huffman, lambda: decode(encoded[0], huffman.huffman_tree, record_steps=False), repeat)
+    if decoded != text:  # A fast but wrong decoder is no use
+        raise ValueError(f"The {engine} engine did not round-trip the text")
+    
+    return {
+        "engine": engine,
+        "size": len(text),
+        "bits": bits,
+        "encode_time": encode_time,
+        "decode_time": decode_time,
+        "encode_mb_per_s": len(text) / encode_time / 1e6,  # The sample text is ASCII, so characters are bytes
+        "decode_mb_per_s": len(text) / decode_time / 1e6
+    }
+
+def run_benchmark(sizes: List[int], engines: Optional[List[str]] = None, repeat: int = 3) -> List[Dict]:
+    """Benchmark every engine on every size and return one row per run"""
+    rows = []  # Benchmark results
+    for size in sizes:  # For each size
+        text = make_text(size)  # Sample text of this size
+        huffman = HuffmanCoding()  # Fresh engine instance
+        huffman.build_huffman_tree(text)  # Build the tree once, outside the timings
+        for engine in engines or ENGINES:  # For each engine
+            row = benchmark_engine(huffman, engine, text, repeat)  # Time the engine
+            if row is not None:  # Skip engines that cannot reach this size
+                rows.append(row)
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Huffman encoders and decoders")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="text lengths to benchmark")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'engine':<10}{'size':>12}{'bits':>14}{'encode s':>12}{'enc MB/s':>10}"
+          f"{'decode s':>12}{'dec MB/s':>10}")  # Table header
+    for row in run_benchmark(args.sizes, args.engines, args.repeat):  # For each measurement
+        print(f"{row['engine']:<10}{row['size']:>12}{row['bits']:>14}"
+              f"{row['encode_time']:>12.6f}{row['encode_mb_per_s']:>10.2f}"
+              f"{row['decode_time']:>12.6f}{row['decode_mb_per_s']:>10.2f}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
@@ -0,0 +1,194 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import json  # Import json to save results for regression tracking
+import os  # Import os to walk the source tree and name temporary files
+import platform  # Import platform to record the Python version with the results
+import tempfile  # Import tempfile for the file compressor's scratch files
+import time  # Import the time module to measure execution time
+import tracemalloc  # Import tracemalloc to measure peak memory
+from typing import Callable, Dict, List, Optional, Tuple  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy for the synthetic corpora and the entropy
+
+from algorithms.greedy.adaptive_huffman import AdaptiveHuffmanCoding  # Import the one-pass coder
+from algorithms.greedy.huffman_coding import HuffmanCoding  # Import the static coder
+from algorithms.greedy.huffman_file import HuffmanFileCompressor  # Import the block file compressor
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # The src directory
+
+def source_corpus(size: int) -> bytes:
+    """Real text: the repository's own Python sources, repeated up to size bytes"""
+    paths = sorted(os.path.join(folder, name) for folder, _, names in os.walk(SOURCE_ROOT)
+                   for name in names if name.endswith(".py"))  # Every source file, in a stable order
+    text = b"".join(open(path, "rb").read() for path in paths)  # All of them back to back
+    return (text * (size // len(text) + 1))[:size]
+
+def binary_corpus(size: int) -> bytes:
+    """Structured binary: little-endian records of a float64 reading, an int32 id and an int16 code"""
+    rng = np.random.default_rng(1)  # Reproducible generator
+    count = size // 14 + 1  # Records needed
+    records = np.zeros(count, dtype=[("reading", "<f8"), ("id", "<i4"), ("code", "<i2")])  # Packed records
+    records["reading"] = np.cumsum(rng.normal(0, 1, count))  # A random walk, like sensor data
+    records["id"] = np.arange(count)  # Increasing ids
+    records["code"] = rng.integers(0, 16, count)  # A few status codes
+    return records.tobytes()[:size]
+
+def skewed_corpus(size: int) -> bytes:
+    """Skewed synthetic: bytes drawn from a geometric distribution, far from uniform"""
+    rng = np.random.default_rng(2)  # Reproducible generator
+    return np.minimum(rng.geometric(0.2, size) - 1, 255).astype(np.uint8).tobytes()
+
+def random_corpus(size: int) -> bytes:
+    """Uniform random bytes, the incompressible worst case"""
+    return np.random.default_rng(3).integers(0, 256, size, dtype=np.uint8).tobytes()
+
+# Corpus name -> generator of that many bytes
+CORPORA = {
+    "source": source_corpus,
+    "binary": binary_corpus,
+    "skewed": skewed_corpus,
+    "random": random_corpus
+}
+
+def compress_with_file(data: bytes) -> bytes:
+    """Round data through HuffmanFileCompressor.compress_file using scratch files"""
+    with tempfile.TemporaryDirectory() as folder:  # Scratch space, removed when done
+        source, target = os.path.join(folder, "input"), os.path.join(folder, "input.huf")
+        with open(source, "wb") as file:
+            file.write(data)
+        HuffmanFileCompressor().compress_file(source, target)  # Compress the file
+        with open(target, "rb") as file:
+            return file.read()
+
+def decompress_with_file(blob: bytes) -> bytes:
+    """Round blob through HuffmanFileCompressor.decompress_file using scratch files"""
+    with tempfile.TemporaryDirectory() as folder:  # Scratch space, removed when done
+        source, target = os.path.join(folder, "input.huf"), os.path.join(folder, "output")
+        with open(source, "wb") as file:
+            file.write(blob)
+        HuffmanFileCompressor().decompress_file(source, target)  # Restore the file
+        with open(target, "rb") as file:
+            return file.read()
+
+# Engine name -> (compressor, decompressor, largest input it can handle here); blobs are self-contained
+ENGINES = {
+    "static": (lambda data: HuffmanCoding().compress(data.decode("latin-1")),  # Bytes as characters 0-255
+               lambda blob: HuffmanCoding().decompress(blob).encode("latin-1"), 10 ** 8),
+    "file": (compress_with_file, decompress_with_file, 10 ** 9),
+    "adaptive": (lambda data: AdaptiveHuffmanCoding().encode(data),
+                 lambda blob: AdaptiveHuffmanCoding().decode(blob), 10 ** 6)  # Pure Python per symbol
+}
+
+DEFAULT_SIZE = 10 ** 6  # Bytes taken from every corpus by default
+
+def entropy_bits(data: bytes) -> float:
+    """Order-0 Shannon entropy of data in bits per byte, the bound for any byte-wise Huffman code"""
+    counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)  # Byte frequencies
+    probabilities = counts[counts > 0] / len(data)  # Probabilities of the bytes that occur
+    return float(-(probabilities * np.log2(probabilities)).sum())
+
+def best_time(run: Callable, argument, repeat: int) -> Tuple[float, object]:
+    """Run a callable repeat times and return (best time, last result)"""
+    best = float("inf")  # Best time so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        result = run(argument)  # Run the engine
+        best = min(best, time.perf_counter() - start)  # Keep the best run
+    return best, result
+
+def peak_memory(run: Callable, argument) -> int:
+    """Peak bytes allocated while running a callable once (tracemalloc also sees NumPy buffers)"""
+    tracemalloc.start()  # Only allocations from here on are counted
+    try:
+        run(argument)  # Run the engine
+        _, peak = tracemalloc.get_traced_memory()  # Highest allocation level reached
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def benchmark_engine(engine: str, corpus: str, data: bytes, repeat: int = 1) -> Optional[Dict]:
+    """
+    Measure one engine on one corpus
+    Returns None when the corpus is larger than the engine can handle
+    """
+    compress, decompress, max_size = ENGINES[engine]  # Look up the engine
+    if len(data) > max_size:  # Skip sizes the engine cannot reach
+        return None
+    
+    # Timings come first and without tracemalloc, which slows allocations down
+    encode_time, blob = best_time(compress, data, repeat)  # Time the compressor
+    decode_time, restored = best_time(decompress, blob, repeat)  # Time the decompressor
+    if restored != data:  # A fast but wrong coder is no use
+        raise ValueError(f"The {engine} engine did not round-trip the {corpus} corpus")
+    
+    entropy = entropy_bits(data)  # Bound in bits per byte
+    bits_per_byte = 8 * len(blob) / len(data)  # Achieved, headers included
+    return {
+        "corpus": corpus,
+        "engine": engine,
+        "size": len(data),
+        "compressed": len(blob),  # True size: everything the decompressor reads
+        "bits_per_byte": bits_per_byte,
+        "entropy_bits_per_byte": entropy,
+        "overhead_pct": 100 * (bits_per_byte / entropy - 1) if entropy > 0 else None,  # Distance from the bound
+        "encode_mb_per_s": len(data) / encode_time / 1e6,
+        "decode_mb_per_s": len(data) / decode_time / 1e6,
+        "encode_peak_mb": peak_memory(compress, data) / 1e6,
+        "decode_peak_mb": peak_memory(decompress, blob) / 1e6
+    }
+
+def load_corpora(size: int, names: Optional[List[str]] = None, folder: Optional[str] = None) -> Dict[str, bytes]:
+    """The built-in corpora (or the named ones) cut to size bytes, plus every file in folder"""
+    corpora = {name: CORPORA[name](size) for name in names or CORPORA}  # Built-in corpora
+    if folder:  # Extra local files, e.g. standard test corpora
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            if os.path.isfile(path):  # Skip subdirectories
+                with open(path, "rb") as file:
+                    corpora[name] = file.read(size)  # At most size bytes of each
+    return corpora
+
+def run_benchmark(corpora: Dict[str, bytes], engines: Optional[List[str]] = None, repeat: int = 1) -> List[Dict]:
+    """Benchmark every engine on every corpus and return one row per run"""
+    rows = []  # Benchmark results
+    for corpus, data in corpora.items():  # For each corpus
+        if not data:  # Nothing to compress
+            continue
+        for engine in engines or ENGINES:  # For each engine
+            row = benchmark_engine(engine, corpus, data, repeat)  # Measure the engine
+            if row is not None:  # Skip engines that cannot reach this size
+                rows.append(row)
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Huffman codecs on local corpora")  # Command line options
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="bytes taken from every corpus")
+    parser.add_argument("--corpora", nargs="+", choices=list(CORPORA), help="built-in corpora (default: all)")
+    parser.add_argument("--corpus-dir", help="folder of extra corpus files")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per timing, the best one is kept")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()  # Parse the command line
+    
+    rows = run_benchmark(load_corpora(args.size, args.corpora, args.corpus_dir), args.engines, args.repeat)  # Measure
+    
+    print(f"{'corpus':<10}{'engine':<10}{'size':>10}{'compressed':>12}{'bits/B':>8}{'H bits/B':>10}{'over %':>8}"
+          f"{'enc MB/s':>10}{'dec MB/s':>10}{'enc MB':>9}{'dec MB':>9}")  # Table header
+    for row in rows:  # For each measurement
+        overhead = f"{row['overhead_pct']:.2f}" if row["overhead_pct"] is not None else "-"  # Undefined for one byte value
+        print(f"{row['corpus']:<10}{row['engine']:<10}{row['size']:>10}{row['compressed']:>12}"
+              f"{row['bits_per_byte']:>8.3f}{row['entropy_bits_per_byte']:>10.3f}{overhead:>8}"
+              f"{row['encode_mb_per_s']:>10.2f}{row['decode_mb_per_s']:>10.2f}"
+              f"{row['encode_peak_mb']:>9.1f}{row['decode_peak_mb']:>9.1f}")
+    
+    if args.json:  # Save the results for regression tracking
+        with open(args.json, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "size": args.size,
+                "repeat": args.repeat,
+                "results": rows
+            }, file, indent=2)
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
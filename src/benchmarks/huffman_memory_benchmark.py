@@ -0,0 +1,81 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import tracemalloc  # Import tracemalloc to measure the memory held by the trees
+from collections import deque  # Import deque for the two queues of the object builder
+from typing import Dict, List, Optional  # Import type hints for better code documentation
+
+from algorithms.greedy.huffman_coding import HuffmanCoding, HuffmanNode  # Import the Huffman trees
+
+class DictHuffmanNode:
+    """HuffmanNode as it was before __slots__, with a per-instance __dict__"""
+    
+    def __init__(self, char: str, freq: int):
+        self.char = char  # Character stored in this node
+        self.freq = freq  # Frequency of the character
+        self.left = None  # Reference to left child
+        self.right = None  # Reference to right child
+
+def build_object_tree(node_class, symbols: List[str], freqs: List[int]):
+    """Build a Huffman tree of node_class objects from ascending frequencies (two-queue method)"""
+    leaves = deque(node_class(symbol, freq) for symbol, freq in zip(symbols, freqs))  # Leaf queue
+    merged = deque()  # Merged-node queue, created in order of weight
+    while len(leaves) + len(merged) > 1:  # Until only the root is left
+        children = []  # The two lightest nodes
+        for _ in range(2):
+            if leaves and (not merged or leaves[0].freq <= merged[0].freq):  # Lighter front wins, leaves on ties
+                children.append(leaves.popleft())
+            else:
+                children.append(merged.popleft())
+        node = node_class('', children[0].freq + children[1].freq)  # Internal node
+        node.left, node.right = children  # Link the children
+        merged.append(node)
+    return (leaves or merged)[0]  # The root
+
+def measure_objects(node_class, symbols: List[str], freqs: List[int]) -> int:
+    """Bytes allocated for a tree of node_class objects that are still held once it is built"""
+    tracemalloc.start()  # Only allocations from here on are counted
+    root = build_object_tree(node_class, symbols, freqs)  # Build the tree
+    held, _ = tracemalloc.get_traced_memory()  # Memory still allocated, i.e. the tree
+    tracemalloc.stop()
+    del root  # Free the tree
+    return held
+
+def measure_arrays(symbols: List[str], freqs: List[int]) -> int:
+    """Bytes of the parallel arrays of the array-backed tree"""
+    huffman = HuffmanCoding()  # Fresh engine instance
+    huffman.build_from_sorted_frequencies(symbols, freqs)  # Build the tree as arrays
+    return huffman.tree_weights.nbytes + huffman.tree_left.nbytes + huffman.tree_right.nbytes
+
+# Layout name -> function measuring the bytes held by a tree
+LAYOUTS = {
+    "dict": lambda symbols, freqs: measure_objects(DictHuffmanNode, symbols, freqs),  # Before __slots__
+    "slots": lambda symbols, freqs: measure_objects(HuffmanNode, symbols, freqs),
+    "arrays": measure_arrays
+}
+
+DEFAULT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]  # Alphabet sizes benchmarked by default
+
+def run_benchmark(sizes: List[int], layouts: Optional[List[str]] = None) -> List[Dict]:
+    """Measure every layout on every alphabet size and return one row per run"""
+    rows = []  # Benchmark results
+    for size in sizes:  # For each alphabet size
+        symbols = [f"w{rank}" for rank in range(size)]  # Word-like symbols, allocated outside the measurements
+        freqs = [10 ** 7 // rank + 1 for rank in range(size, 0, -1)]  # Zipf-like, ascending
+        nodes = 2 * size - 1  # Leaves plus internal nodes
+        for layout in layouts or LAYOUTS:  # For each layout
+            held = LAYOUTS[layout](symbols, freqs)  # Bytes held by the tree
+            rows.append({"layout": layout, "size": size, "nodes": nodes, "bytes": held, "bytes_per_node": held / nodes})
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory per node of the Huffman tree layouts")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="alphabet sizes to measure")
+    parser.add_argument("--layouts", nargs="+", choices=list(LAYOUTS), help="layouts to measure (default: all)")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'layout':<8}{'symbols':>10}{'nodes':>10}{'MB':>10}{'bytes/node':>12}")  # Table header
+    for row in run_benchmark(args.sizes, args.layouts):  # For each measurement
+        print(f"{row['layout']:<8}{row['size']:>10}{row['nodes']:>10}{row['bytes'] / 1e6:>10.2f}"
+              f"{row['bytes_per_node']:>12.1f}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
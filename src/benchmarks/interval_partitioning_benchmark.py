@@ -0,0 +1,74 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import time  # Import the time module to measure execution time
+from typing import Dict, List, Optional  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy to generate random intervals
+
+from algorithms.greedy.interval_partitioning import IntervalPartitioning  # Import the interval partitioning engines
+
+# Engine name -> (IntervalPartitioning method, largest input it can handle here, whether it takes lists)
+ENGINES = {
+    "heap": ("partition", 10 ** 6, True),  # Python heap over lists
+    "sweep": ("partition_sweep", 10 ** 7, False),  # NumPy event sort plus one Python pass
+    "peak_only": ("min_resources", 10 ** 7, False)  # Fully vectorized, no assignment
+}
+
+DEFAULT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]  # Numbers of intervals benchmarked by default
+
+def random_intervals(n: int, seed: int = 0, horizon: int = 10 ** 9, max_length: int = 10 ** 5):
+    """Random half-open intervals spread over [0, horizon)"""
+    rng = np.random.default_rng(seed)  # Reproducible generator
+    starts = rng.integers(0, horizon, n)  # Uniform start times
+    ends = starts + rng.integers(1, max_length, n)  # Positive lengths
+    return starts, ends
+
+def benchmark_engine(engine: str, starts: np.ndarray, ends: np.ndarray, repeat: int = 1) -> Optional[Dict]:
+    """
+    Time one engine on one input
+    Returns None when the input is larger than the engine can handle
+    """
+    method_name, max_n, wants_lists = ENGINES[engine]  # Look up the engine
+    if len(starts) > max_n:  # Skip inputs the engine cannot reach
+        return None
+    partitioning = IntervalPartitioning()  # Fresh engine instance
+    args = (starts.tolist(), ends.tolist()) if wants_lists else (starts, ends)  # Input in the engine's format
+    
+    best = float("inf")  # Best total time so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        getattr(partitioning, method_name)(*args)  # Run the engine
+        best = min(best, time.perf_counter() - start)  # Keep the best run
+    
+    return {
+        "engine": engine,
+        "intervals": len(starts),
+        "peak_concurrency": partitioning.peak_concurrency,
+        "time": best,
+        "intervals_per_second": len(starts) / best if best > 0 else float("inf")
+    }
+
+def run_benchmark(sizes: List[int], engines: Optional[List[str]] = None, repeat: int = 1) -> List[Dict]:
+    """Benchmark every engine on every size and return one row per run"""
+    rows = []  # Benchmark results
+    for n in sizes:  # For each size
+        starts, ends = random_intervals(n)  # Same input for every engine
+        for engine in engines or ENGINES:  # For each engine
+            row = benchmark_engine(engine, starts, ends, repeat)  # Time the engine
+            if row is not None:  # Skip engines that cannot reach this size
+                rows.append(row)
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the interval partitioning engines")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of intervals")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'engine':<10}{'intervals':>12}{'peak':>8}{'time s':>12}{'intervals/s':>14}")  # Table header
+    for row in run_benchmark(args.sizes, args.engines, args.repeat):  # For each measurement
+        print(f"{row['engine']:<10}{row['intervals']:>12}{row['peak_concurrency']:>8}{row['time']:>12.4f}"
+              f"{row['intervals_per_second']:>14.3g}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
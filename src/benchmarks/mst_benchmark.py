@@ -0,0 +1,93 @@
+import argparse  # Import argparse to read benchmark options from the command line
+import time  # Import the time module to measure execution time
+from typing import Dict, List, Optional  # Import type hints for better code documentation
+
+import numpy as np  # Import NumPy to generate random graphs
+
+from algorithms.greedy.minimum_spanning_tree import MinimumSpanningTree  # Import the MST engines
+
+# Engine name -> largest number of edges the engine can handle here
+MAX_EDGES = {
+    "kruskal": 10 ** 7,
+    "filter_kruskal": 10 ** 7,
+    "boruvka": 10 ** 7,
+    "prim": 10 ** 7,
+    "auto": 10 ** 7
+}
+
+# Engine name -> largest number of vertices, for engines bounded by vertices
+MAX_VERTICES = {
+    "prim": 4096  # Bounded by the V x V adjacency matrix (128 MB at this size)
+}
+
+DEFAULT_SIZES = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]  # Edge counts benchmarked by default
+DEFAULT_DEGREES = [4, 64, 1024]  # Average vertex degrees (2E / V) benchmarked by default
+
+def make_graph(edges: int, degree: float, seed: int = 0):
+    """Generate a random multigraph with the given number of edges and average degree"""
+    rng = np.random.default_rng(seed)  # Reproducible generator
+    vertices = max(2, int(2 * edges / degree))  # Vertices giving that average degree
+    u = rng.integers(0, vertices, edges)  # First endpoint of every edge
+    v = rng.integers(0, vertices, edges)  # Second endpoint of every edge
+    w = rng.integers(1, 10 ** 6, edges)  # Weight of every edge
+    return vertices, u, v, w
+
+def benchmark_engine(mst: MinimumSpanningTree, engine: str, vertices: int, u, v, w,
+                     repeat: int = 3) -> Optional[Dict]:
+    """
+    Time one engine on one graph
+    Returns None when the graph is beyond what the engine can handle
+    """
+    if len(w) > MAX_EDGES[engine] or vertices > MAX_VERTICES.get(engine, vertices):  # Skip sizes the engine cannot reach
+        return None
+    
+    best = float("inf")  # Best time so far
+    for _ in range(repeat):  # Repeat to reduce noise
+        start = time.perf_counter()  # Start the clock
+        tree = mst.find_mst_arrays(vertices, u, v, w, engine)  # Run the engine
+        best = min(best, time.perf_counter() - start)  # Keep the best run
+    
+    return {
+        "engine": engine,
+        "chosen": mst.engine,  # The engine that actually ran (differs for auto)
+        "edges": len(w),
+        "vertices": vertices,
+        "tree_edges": len(tree),
+        "weight": mst.calculate_mst_weight(tree),
+        "operations": mst.operations,
+        "time": best
+    }
+
+def run_benchmark(sizes: List[int], degrees: List[float], engines: Optional[List[str]] = None,
+                  repeat: int = 3) -> List[Dict]:
+    """Benchmark every engine on every graph and return one row per run"""
+    mst = MinimumSpanningTree()  # Shared front end
+    rows = []  # Benchmark results
+    for size in sizes:  # For each size
+        for degree in degrees:  # For each density
+            vertices, u, v, w = make_graph(size, degree)  # Random graph of this size and density
+            weights = set()  # Tree weight found by every engine
+            for engine in engines or MAX_EDGES:  # For each engine
+                row = benchmark_engine(mst, engine, vertices, u, v, w, repeat)  # Time the engine
+                if row is not None:  # Skip engines that cannot reach this size
+                    rows.append(row)
+                    weights.add(row["weight"])
+            if len(weights) > 1:  # A fast but wrong engine is no use
+                raise ValueError(f"The engines disagree on the MST weight for {size} edges of degree {degree}")
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the minimum spanning tree engines")  # Command line options
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="edge counts to benchmark")
+    parser.add_argument("--degrees", type=float, nargs="+", default=DEFAULT_DEGREES, help="average vertex degrees")
+    parser.add_argument("--engines", nargs="+", choices=list(MAX_EDGES), help="engines to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the best one is kept")
+    args = parser.parse_args()  # Parse the command line
+    
+    print(f"{'engine':<16}{'chosen':<16}{'edges':>10}{'vertices':>10}{'tree':>10}{'weight':>16}{'time s':>12}")  # Table header
+    for row in run_benchmark(args.sizes, args.degrees, args.engines, args.repeat):  # For each measurement
+        print(f"{row['engine']:<16}{row['chosen']:<16}{row['edges']:>10}{row['vertices']:>10}"
+              f"{row['tree_edges']:>10}{row['weight']:>16}{row['time']:>12.6f}")
+
+if __name__ == "__main__":  # Check if this script is being run directly (not imported)
+    main()  # Run the benchmark
\ No newline at end of file
@@ -1,6 +1,6 @@
 import random  # Import the random module for generating random values
 from PyQt5.QtWidgets import (  # Import Qt widgets for GUI components
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QComboBox, QLineEdit, QTabWidget, QSpinBox, QTableWidget, QTableWidgetItem,
     QGroupBox, QRadioButton, QSlider, QTextEdit, QMessageBox
 )
@@ -28,7 +28,7 @@ from algorithms.dynamic_programming.lcs import LCS  # Import Longest Common Subs
 from algorithms.greedy.activity_selection import ActivitySelection  # Import Activity Selection algorithm
 from algorithms.greedy.coin_change import CoinChange  # Import Coin Change algorithm
 from algorithms.greedy.huffman_coding import HuffmanCoding  # Import Huffman Coding algorithm
-from algorithms.greedy.kruskal import Kruskal  # Import Kruskal's algorithm for minimum spanning trees
+from algorithms.greedy.kruskal import Kruskal, parse_edges_text  # Import Kruskal's algorithm for minimum spanning trees
 
 # Import search algorithm implementations
 from algorithms.search.binary_search import BinarySearch  # Import Binary Search algorithm
@@ -36,6 +36,10 @@ from algorithms.search.binary_search import BinarySearch  # Import Binary Search
 class AlgorithmVisualizer(QMainWindow):
     """Main application window"""
     
+    LCS_DP_CELL_LIMIT = 250_000  # Largest LCS DP table (cells) before switching to the Myers engine
+    LCS_PAGE_SIZE = 4096  # Characters per line on each page of a large LCS alignment
+    KRUSKAL_PAGE_SIZE = 4096  # Lines appended at a time when listing Kruskal edges and steps
+    
     def __init__(self):
         super().__init__()  # Initialize the parent QMainWindow
         self.setWindowTitle("Algorithm Visualizer")  # Set the window title
@@ -439,7 +443,7 @@ class AlgorithmVisualizer(QMainWindow):
         kruskal_widget = QWidget()  # Create a widget for Kruskal parameters
         kruskal_layout = QVBoxLayout(kruskal_widget)  # Create a vertical layout for the widget
         self.kruskal_vertices_spin = QSpinBox()  # Create a spin box for number of vertices
-        self.kruskal_vertices_spin.setRange(2, 10)  # Set the range (2-10)
+        self.kruskal_vertices_spin.setRange(2, 1000)  # Set the range (2-1000)
         self.kruskal_vertices_spin.setValue(5)  # Set default value
         kruskal_layout.addWidget(QLabel("Vertices:"))  # Add a label
         kruskal_layout.addWidget(self.kruskal_vertices_spin)  # Add the spin box
@@ -746,7 +750,11 @@ class AlgorithmVisualizer(QMainWindow):
             
             # Run the algorithm
             lcs = self.dp_algorithms["LCS"]  # Get the algorithm instance
-            lcs_str, dp_table = lcs.find_lcs(str1, str2)  # Find the LCS
+            if len(str1) * len(str2) <= self.LCS_DP_CELL_LIMIT:  # Small inputs can afford the full DP table
+                lcs_str, dp_table = lcs.find_lcs(str1, str2)  # Find the LCS
+            else:
+                lcs_str, _ = lcs.find_lcs_myers(str1, str2)  # Use the linear-space Myers engine
+                dp_table = None  # No DP table to show
             
             # Display results
             self.dp_viz_text.clear()  # Clear the visualization text
@@ -754,15 +762,22 @@ class AlgorithmVisualizer(QMainWindow):
             self.dp_viz_text.append(f"String 2: {str2}")  # Display second string
             self.dp_viz_text.append(f"LCS: {lcs_str} (length: {len(lcs_str)})")  # Display LCS and its length
             
-            # Show the alignment
+            # Show the alignment one page at a time so large inputs don't freeze the window
             self.dp_viz_text.append("\nAlignment:")  # Add header for alignment
-            alignment = lcs.print_lcs_alignment(str1, str2, lcs_str)  # Get the alignment visualization
-            self.dp_viz_text.append(alignment)  # Display the alignment
+            if len(str1) + len(str2) <= self.LCS_PAGE_SIZE:  # Short inputs fit in the classic layout
+                self.dp_viz_text.append(lcs.print_lcs_alignment(str1, str2, lcs_str))  # Display the alignment
+            else:
+                for page in lcs.iter_lcs_alignment(str1, str2, lcs_str, page_size=self.LCS_PAGE_SIZE):  # For each page
+                    self.dp_viz_text.append(page)  # Display the page
+                    QApplication.processEvents()  # Keep the window responsive between pages
             
             # Show DP table
-            self.dp_viz_text.append("\nDP Table:")  # Add header for DP table
-            for row in dp_table:  # Loop through each row
-                self.dp_viz_text.append(" ".join(str(cell) for cell in row))  # Display formatted row
+            if dp_table is not None:  # Only the DP engine builds a table
+                self.dp_viz_text.append("\nDP Table:")  # Add header for DP table
+                for row in dp_table:  # Loop through each row
+                    self.dp_viz_text.append(" ".join(str(cell) for cell in row))  # Display formatted row
+            else:
+                self.dp_viz_text.append(f"\nEdit distance: {lcs.edit_distance}")  # Myers reports the edit distance instead
             
             # Update metrics
             self.dp_metrics_table.update_metrics({  # Update metrics table
@@ -862,6 +877,10 @@ class AlgorithmVisualizer(QMainWindow):
                 self.greedy_viz_text.clear()  # Clear the visualization text
                 self.greedy_viz_text.append(f"Amount: {amount}")  # Display the amount
                 self.greedy_viz_text.append(f"Coin denominations: {coins}")  # Display coin denominations
+                if results['canonical']:  # Greedy is optimal for every amount with these coins
+                    self.greedy_viz_text.append("Canonical coin system: greedy is always optimal")  # Display canonicity
+                else:
+                    self.greedy_viz_text.append("Non-canonical coin system: greedy may be suboptimal")  # Display canonicity
                 
                 self.greedy_viz_text.append("\nGreedy Approach Result:")  # Add header for greedy results
                 if results['greedy']['count'] == -1:  # Check if no solution was found
@@ -957,10 +976,8 @@ class AlgorithmVisualizer(QMainWindow):
                     edge_lines = [f"{u},{v},{w}" for u, v, w in edges]  # Format each edge
                     self.kruskal_edges_text.setPlainText("\n".join(edge_lines))  # Update edges text
                 else:
-                    edges = []  # Initialize edges list
-                    for line in edges_text.strip().split('\n'):  # Process each line
-                        u, v, w = map(int, line.split(','))  # Parse edge data
-                        edges.append((u, v, w))  # Add the edge
+                    u, v, w = parse_edges_text(edges_text)  # Bulk-parse all lines at once
+                    edges = list(zip(u.tolist(), v.tolist(), w.tolist()))  # Edges as (u, v, weight) tuples
                 
                 # Run the algorithm
                 kruskal = self.greedy_algorithms["Kruskal"]  # Get the algorithm instance
@@ -978,8 +995,8 @@ class AlgorithmVisualizer(QMainWindow):
                 self.greedy_viz_text.append(f"Graph has {vertices} vertices and {len(edges)} edges")  # Display graph info
                 
                 self.greedy_viz_text.append("\nInput Edges:")  # Add header for input edges
-                for u, v, w in edges:  # Loop through edges
-                    self.greedy_viz_text.append(f"Edge ({u}-{v}) with weight {w}")  # Display each edge
+                self.append_pages(self.greedy_viz_text,  # Display each edge
+                                  (f"Edge ({u}-{v}) with weight {w}" for u, v, w in edges), self.KRUSKAL_PAGE_SIZE)
                 
                 self.greedy_viz_text.append("\nMinimum Spanning Tree:")  # Add header for MST
                 for u, v, w in mst:  # Loop through MST edges
@@ -987,19 +1004,15 @@ class AlgorithmVisualizer(QMainWindow):
                 
                 self.greedy_viz_text.append(f"\nTotal MST weight: {mst_weight}")  # Display total MST weight
                 
-                # Show steps
+                # Show steps from the event log: one (edge index, accepted) entry per edge considered
                 self.greedy_viz_text.append("\nKruskal's Algorithm Steps:")  # Add header for steps
-                for step_type, edge, mst_edges in kruskal.steps:  # Loop through steps
-                    if step_type == "init":  # Initial step
-                        self.greedy_viz_text.append(f"Initial edges: {edge}")  # Display initial edges
-                    elif step_type == "sort":  # Sort step
-                        self.greedy_viz_text.append(f"Sorted edges by weight: {edge}")  # Display sorted edges
-                    elif step_type == "add":  # Add edge step
-                        self.greedy_viz_text.append(f"Added edge {edge} to MST")  # Display added edge
-                    elif step_type == "skip":  # Skip edge step
-                        self.greedy_viz_text.append(f"Skipped edge {edge} (would create cycle)")  # Display skipped edge
-                    elif step_type == "final":  # Final step
-                        self.greedy_viz_text.append(f"Final MST: {mst_edges}")  # Display final MST
+                self.greedy_viz_text.append(f"Initial edges: {len(edges)}")  # Display the number of edges
+                self.greedy_viz_text.append("Edges considered in order of increasing weight:")  # The log is in sorted order
+                events = (kruskal.event(step) for step in range(len(kruskal.event_accepted)))  # Replay the log lazily
+                self.append_pages(self.greedy_viz_text, (  # Display each added or skipped edge
+                    f"Added edge {edge} to MST" if accepted else f"Skipped edge {edge} (would create cycle)"
+                    for edge, accepted in events), self.KRUSKAL_PAGE_SIZE)
+                self.greedy_viz_text.append(f"Final MST: {len(mst)} edges")  # Display final MST size
                 
                 # Update metrics
                 self.greedy_metrics_table.update_metrics({  # Update metrics table
@@ -1013,6 +1026,18 @@ class AlgorithmVisualizer(QMainWindow):
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Error with Kruskal MST input: {str(e)}")  # Show error message
     
+    def append_pages(self, text_edit: QTextEdit, lines, page_size: int):
+        """Append lines to a text edit a page at a time so long listings don't freeze the window"""
+        page = []  # Lines of the current page
+        for line in lines:  # For each line
+            page.append(line)  # Add it to the page
+            if len(page) == page_size:  # The page is full
+                text_edit.append("\n".join(page))  # Display the page
+                QApplication.processEvents()  # Keep the window responsive between pages
+                page = []  # Start a new page
+        if page:  # Display the last partial page
+            text_edit.append("\n".join(page))
+    
     def show_current_step(self):
         """Show the current step in the animation"""
         if not self.current_steps or self.current_step_index >= len(self.current_steps):  # Check if we have valid steps